@@ -1,125 +1,244 @@
 #!/usr/bin/env python3
 """
 Process audio/video files in a directory using audiobox-aesthetics
-Usage: python process_audio.py <input_directory> <output_file>
+Usage: python process_audio.py <input_directory> <output_file> [batch_size]
 """
 
 import sys
 import os
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+import numpy as np
+import torch
 from tqdm import tqdm
 
 # Supported audio and video formats
-AUDIO_EXTENSIONS = {'.wav', '.flac', '.mp3', '.m4a', '.ogg', '.aac', '.wma', '.aiff', '.au'}
-VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v'}
+AUDIO_EXTENSIONS = frozenset({'.wav', '.flac', '.mp3', '.m4a', '.ogg', '.aac', '.wma', '.aiff', '.au'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v'})
+SUPPORTED_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+
+# Number of files submitted to a single predictor.forward() call
+BATCH_SIZE = 16
+
+# Sample rate expected by the model
+SAMPLE_RATE = 16000
+
+# Read size for FFmpeg output pipes (1 MB keeps the syscall count low)
+PIPE_BUFFER_SIZE = 1 << 20
+
+# Byte alignment of PCM buffers so numpy/torch kernels get aligned SIMD loads
+BUFFER_ALIGNMENT = 32
+
+# Write buffer size for the results file
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Maximum number of videos decoded by a single FFmpeg invocation (keeps argv short)
+FFMPEG_CHUNK_SIZE = 50
+
+# Video chunks decoded ahead of the batch being scored; bounds the decoded audio held in RAM
+EXTRACTION_PREFETCH_CHUNKS = 3
 
 def find_media_files(directory):
-    """Find all supported audio and video files in directory"""
+    """Find all supported audio and video files in directory
+
+    Returns sorted (path, basename, extension) tuples so callers never
+    have to split the path again.
+    """
     media_files = []
+    pending = [directory]
+
+    # scandir reuses the file type from the directory listing, so no extra stat per entry
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext in SUPPORTED_EXTENSIONS:
+                            media_files.append((entry.path, entry.name, ext))
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            continue
 
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            file_path = os.path.join(root, file)
-            ext = os.path.splitext(file)[1].lower()
+    return sorted(media_files)
 
-            if ext in AUDIO_EXTENSIONS or ext in VIDEO_EXTENSIONS:
-                media_files.append(file_path)
+def pcm_output_args(target):
+    """FFmpeg output options writing raw 16kHz mono PCM to target"""
+    return [
+        '-vn',                     # Disable video output
+        '-f', 's16le',             # Raw samples, no WAV container
+        '-acodec', 'pcm_s16le',    # Use 16-bit PCM audio codec
+        '-ar', str(SAMPLE_RATE),   # Set sample rate to 16kHz (required by model)
+        '-ac', '1',                # Convert to mono
+        target
+    ]
+
+def aligned_empty(n, dtype=np.int16, align=BUFFER_ALIGNMENT):
+    """Allocate an uninitialised 1-D array whose data starts on an align-byte boundary"""
+    itemsize = np.dtype(dtype).itemsize
+    buf = np.empty(n + align // itemsize, dtype=dtype)
+    offset = (-buf.ctypes.data) % align // itemsize
+    return buf[offset:offset + n]
+
+class PcmBuffer:
+    """Growable aligned int16 buffer that pipe reads land in directly"""
+
+    def __init__(self, capacity=PIPE_BUFFER_SIZE // 2):
+        self.samples = aligned_empty(capacity)
+        self.nbytes = 0
+
+    def read_from(self, fd):
+        """Read once from fd into the free space, returning the number of bytes read"""
+        if self.nbytes == self.samples.nbytes:
+            grown = aligned_empty(self.samples.size * 2)
+            grown[:self.samples.size] = self.samples
+            self.samples = grown
+
+        free = memoryview(self.samples).cast('B')[self.nbytes:]
+        count = os.readv(fd, [free])
+        self.nbytes += count
+        return count
+
+    def pcm(self):
+        """The int16 samples read so far"""
+        return self.samples[:self.nbytes // 2]
+
+def pcm_to_audio_input(pcm):
+    """Wrap s16le PCM samples as a predictor input, or None if empty"""
+    if pcm.size == 0:
+        return None
 
-    return sorted(media_files)
+    # Convert into an aligned float32 array in one pass, without a temporary
+    waveform = aligned_empty(pcm.size, dtype=np.float32)
+    np.divide(pcm, np.float32(32768.0), out=waveform, dtype=np.float32)
+    return {"path": torch.from_numpy(waveform).unsqueeze(0), "sample_rate": SAMPLE_RATE}
 
-def extract_audio_from_video(video_path):
-    """Extract audio from video file using FFmpeg"""
-    import tempfile
+def decode_with_ffmpeg(media_path):
+    """Decode any FFmpeg-readable file straight into memory via stdout"""
     import subprocess
 
     try:
-        # Print will be handled by progress bar in calling function
-        pass
-
-        # Create temporary audio file
-        temp_audio = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-        temp_audio_path = temp_audio.name
-        temp_audio.close()
-
-        # Use FFmpeg to extract audio
         ffmpeg_cmd = [
             'ffmpeg',
-            '-i', video_path,          # Input video file
-            '-vn',                     # Disable video output
-            '-acodec', 'pcm_s16le',    # Use 16-bit PCM audio codec
-            '-ar', '16000',            # Set sample rate to 16kHz (required by model)
-            '-ac', '1',                # Convert to mono
-            '-y',                      # Overwrite output file if exists
-            temp_audio_path
-        ]
-
-        # Run FFmpeg command
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-
-        if result.returncode == 0:
-            # Check if the output file was created and has content
-            if os.path.exists(temp_audio_path) and os.path.getsize(temp_audio_path) > 0:
-                return temp_audio_path
-            else:
-                return None
-        else:
+            '-threads', '1',           # One thread per process; files run in parallel
+            '-i', media_path,          # Input media file
+        ] + pcm_output_args('pipe:1')
+
+        process = subprocess.Popen(
+            ffmpeg_cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        buffer = PcmBuffer()
+        while buffer.read_from(process.stdout.fileno()):
+            pass
+        process.stdout.close()
+
+        if process.wait() != 0:
             return None
+        return pcm_to_audio_input(buffer.pcm())
 
     except FileNotFoundError:
         return None
     except Exception as e:
         return None
 
-def convert_audio_format(audio_path):
-    """Convert unsupported audio formats to WAV using FFmpeg"""
-    import tempfile
+def extract_audio_from_video(video_path):
+    """Extract audio from video file using FFmpeg"""
+    return decode_with_ffmpeg(video_path)
+
+def extract_audio_from_videos(video_paths):
+    """Extract audio from several video files with a single FFmpeg invocation
+
+    Each output is written to its own pipe so nothing touches the disk.
+    Returns predictor inputs (or None on failure) in the order of video_paths.
+    """
+    import selectors
     import subprocess
 
-    try:
-        # Print will be handled by progress bar in calling function
-        pass
+    pipes = [os.pipe() for _ in video_paths]
 
-        # Create temporary audio file
-        temp_audio = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-        temp_audio_path = temp_audio.name
-        temp_audio.close()
+    # One input per video, then one output per input mapped to its first audio stream
+    ffmpeg_cmd = ['ffmpeg']
+    for video_path in video_paths:
+        ffmpeg_cmd += ['-threads', '1', '-i', video_path]
+    for index, (_, write_fd) in enumerate(pipes):
+        ffmpeg_cmd += ['-map', f'{index}:a:0'] + pcm_output_args(f'pipe:{write_fd}')
 
-        # Use FFmpeg to convert audio
-        ffmpeg_cmd = [
-            'ffmpeg',
-            '-i', audio_path,          # Input audio file
-            '-acodec', 'pcm_s16le',    # Use 16-bit PCM audio codec
-            '-ar', '16000',            # Set sample rate to 16kHz (required by model)
-            '-ac', '1',                # Convert to mono
-            '-y',                      # Overwrite output file if exists
-            temp_audio_path
-        ]
-
-        # Run FFmpeg command
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-
-        if result.returncode == 0:
-            # Check if the output file was created and has content
-            if os.path.exists(temp_audio_path) and os.path.getsize(temp_audio_path) > 0:
-                return temp_audio_path
-            else:
-                return None
-        else:
-            return None
+    buffers = [PcmBuffer() for _ in video_paths]
+    succeeded = False
+    try:
+        process = subprocess.Popen(
+            ffmpeg_cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            pass_fds=[write_fd for _, write_fd in pipes]
+        )
+    except Exception:
+        process = None
+    finally:
+        for _, write_fd in pipes:
+            os.close(write_fd)
+
+    if process is not None:
+        # ffmpeg interleaves writes across outputs, so drain every pipe as data arrives
+        with selectors.DefaultSelector() as selector:
+            for index, (read_fd, _) in enumerate(pipes):
+                selector.register(read_fd, selectors.EVENT_READ, index)
+            while selector.get_map():
+                for key, _ in selector.select():
+                    if not buffers[key.data].read_from(key.fd):
+                        selector.unregister(key.fd)
+        succeeded = process.wait() == 0
+
+    for read_fd, _ in pipes:
+        os.close(read_fd)
+
+    audio_inputs = []
+    for video_path, buffer in zip(video_paths, buffers):
+        audio_input = pcm_to_audio_input(buffer.pcm()) if succeeded else None
+        if audio_input is None:
+            # A single unreadable input aborts the whole invocation, so retry this file on its own
+            audio_input = extract_audio_from_video(video_path)
+        audio_inputs.append(audio_input)
+
+    return audio_inputs
 
-    except FileNotFoundError:
-        return None
+def convert_audio_format(audio_path):
+    """Convert unsupported audio formats to 16kHz mono PCM using FFmpeg"""
+    return decode_with_ffmpeg(audio_path)
+
+def run_prediction(predictor, audio_input):
+    """Run prediction for a single file, returning (metrics, error_message)"""
+    try:
+        prediction = predictor.forward([audio_input])
     except Exception as e:
-        return None
+        return None, str(e)
+
+    if prediction and len(prediction) > 0:
+        return prediction[0], None
+    return None, 'No prediction returned'
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python process_audio.py <input_directory> <output_file>")
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python process_audio.py <input_directory> <output_file> [batch_size]")
         sys.exit(1)
 
     input_dir = sys.argv[1]
     output_file = sys.argv[2]
+    batch_size = int(sys.argv[3]) if len(sys.argv) == 4 else BATCH_SIZE
+
+    if batch_size < 1:
+        print(f"Error: Batch size must be at least 1, got {batch_size}.")
+        sys.exit(1)
 
     if not os.path.exists(input_dir):
         print(f"Error: Input directory '{input_dir}' does not exist.")
@@ -136,139 +255,181 @@ def main():
 
     print(f"Found {len(media_files)} media files to process")
 
+    # FFmpeg runs as an external process, so threads are enough to keep every core busy
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
     try:
         from audiobox_aesthetics.infer import initialize_predictor
 
         print("Initializing predictor...")
         predictor = initialize_predictor()
 
-        results = []
-        temp_audio_files = []  # Track temporary files for cleanup
+        # Results are stored by index so they keep the sorted file order
+        results = [None] * len(media_files)
+
+        # Extract audio from videos a few chunks ahead of the batch being scored,
+        # so extraction overlaps with inference without decoding the whole
+        # directory into memory at once
+        video_files = [path for path, _, ext in media_files if ext in VIDEO_EXTENSIONS]
+        if video_files:
+            print(f"🎥 Extracting audio from {len(video_files)} video file(s)")
+
+        # One FFmpeg process per chunk of about a batch of videos
+        chunk_size = max(1, min(FFMPEG_CHUNK_SIZE, batch_size))
+        video_chunks = [video_files[i:i + chunk_size] for i in range(0, len(video_files), chunk_size)]
+        chunk_positions = {}  # video -> (chunk index, position in chunk)
+        for chunk_index, chunk in enumerate(video_chunks):
+            for position, video_file in enumerate(chunk):
+                chunk_positions[video_file] = (chunk_index, position)
+
+        # Videos are consumed in order, so the oldest chunk in flight is always the current one
+        extraction_futures = deque()
+        next_chunk = 0
+
+        def prefetch_chunks():
+            nonlocal next_chunk
+            while next_chunk < len(video_chunks) and len(extraction_futures) < EXTRACTION_PREFETCH_CHUNKS:
+                extraction_futures.append(executor.submit(extract_audio_from_videos, video_chunks[next_chunk]))
+                next_chunk += 1
+
+        prefetch_chunks()
 
         # Create progress bar for file processing
-        progress_bar = tqdm(media_files, desc="Processing files", unit="file")
+        progress_bar = tqdm(total=len(media_files), desc="Processing files", unit="file")
+
+        for start in range(0, len(media_files), batch_size):
+            batch_indices = range(start, min(start + batch_size, len(media_files)))
 
-        for media_file in progress_bar:
-            # Update progress bar description with current file
-            current_file = os.path.basename(media_file)
+            # Update progress bar description with current batch
+            current_file = media_files[start][1]
             progress_bar.set_description(f"Processing: {current_file[:30]}{'...' if len(current_file) > 30 else ''}")
 
-            file_ext = os.path.splitext(media_file)[1].lower()
-            audio_file = media_file
-
-            # Extract audio from video if needed
-            if file_ext in VIDEO_EXTENSIONS:
-                progress_bar.write(f"🎥 Extracting audio from video: {os.path.basename(media_file)}")
-                audio_file = extract_audio_from_video(media_file)
-                if audio_file is None:
-                    progress_bar.write(f"✗ Failed to extract audio from {os.path.basename(media_file)}")
-                    results.append({
-                        'file': os.path.basename(media_file),
-                        'path': media_file,
-                        'error': 'Failed to extract audio'
-                    })
-                    continue
-                progress_bar.write(f"✓ Successfully extracted audio from {os.path.basename(media_file)}")
-                temp_audio_files.append(audio_file)
+            batch = []  # (index, media_file, name, audio_input)
+            for index in batch_indices:
+                media_file, name, _ = media_files[index]
+                audio_input = {"path": media_file}
+
+                if media_file in chunk_positions:
+                    chunk_index, position = chunk_positions.pop(media_file)
+                    chunk_inputs = extraction_futures[0].result()
+                    # Drop the chunk's reference so the waveform is freed once scored
+                    audio_input, chunk_inputs[position] = chunk_inputs[position], None
+                    if position == len(video_chunks[chunk_index]) - 1:
+                        extraction_futures.popleft()
+                        prefetch_chunks()
+                    if audio_input is None:
+                        progress_bar.write(f"✗ Failed to extract audio from {name}")
+                        results[index] = {
+                            'file': name,
+                            'path': media_file,
+                            'error': 'Failed to extract audio'
+                        }
+                        continue
+                    progress_bar.write(f"✓ Successfully extracted audio from {name}")
 
-            try:
-                # Run prediction
-                prediction = predictor.forward([{"path": audio_file}])
+                batch.append((index, media_file, name, audio_input))
 
-                if prediction and len(prediction) > 0:
-                    result = prediction[0]
-                    results.append({
-                        'file': os.path.basename(media_file),
-                        'path': media_file,
-                        'metrics': result
-                    })
-                else:
-                    results.append({
-                        'file': os.path.basename(media_file),
+            if not batch:
+                progress_bar.update(len(batch_indices))
+                continue
+
+            try:
+                # Run prediction on the whole batch at once
+                predictions = predictor.forward([audio_input for _, _, _, audio_input in batch])
+            except Exception:
+                predictions = None
+
+            if predictions and len(predictions) == len(batch):
+                for (index, media_file, name, _), metrics in zip(batch, predictions):
+                    results[index] = {
+                        'file': name,
                         'path': media_file,
-                        'error': 'No prediction returned'
-                    })
-
-            except Exception as e:
-                error_message = str(e)
-                progress_bar.write(f"✗ Error processing {os.path.basename(media_file)}: {e}")
-
-                # Check if this is an audio format issue and we haven't already converted
-                if ("Format not recognised" in error_message or "Error opening" in error_message) and audio_file == media_file:
-                    progress_bar.write(f"🔄 Attempting format conversion for {os.path.basename(media_file)}")
-                    converted_audio_file = convert_audio_format(media_file)
-
-                    if converted_audio_file is not None:
-                        temp_audio_files.append(converted_audio_file)
-                        try:
-                            # Retry prediction with converted audio
-                            prediction = predictor.forward([{"path": converted_audio_file}])
-
-                            if prediction and len(prediction) > 0:
-                                result = prediction[0]
-                                results.append({
-                                    'file': os.path.basename(media_file),
-                                    'path': media_file,
-                                    'metrics': result
-                                })
-                                progress_bar.write(f"✓ Successfully processed {os.path.basename(media_file)} after format conversion")
-                            else:
-                                results.append({
-                                    'file': os.path.basename(media_file),
-                                    'path': media_file,
-                                    'error': 'No prediction returned after format conversion'
-                                })
-                        except Exception as retry_error:
-                            progress_bar.write(f"✗ Error processing converted audio for {os.path.basename(media_file)}: {retry_error}")
-                            results.append({
-                                'file': os.path.basename(media_file),
-                                'path': media_file,
-                                'error': f'Failed after format conversion: {str(retry_error)}'
-                            })
+                        'metrics': metrics
+                    }
+            else:
+                # A single unreadable file fails the whole batch, so retry file by file
+                needs_conversion = []  # (index, media_file, name, error_message)
+                for index, media_file, name, audio_input in batch:
+                    metrics, error_message = run_prediction(predictor, audio_input)
+                    if metrics is not None:
+                        results[index] = {
+                            'file': name,
+                            'path': media_file,
+                            'metrics': metrics
+                        }
+                        continue
+
+                    progress_bar.write(f"✗ Error processing {name}: {error_message}")
+
+                    # Check if this is an audio format issue and we haven't already converted
+                    if ("Format not recognised" in error_message or "Error opening" in error_message) and isinstance(audio_input["path"], str):
+                        progress_bar.write(f"🔄 Attempting format conversion for {name}")
+                        needs_conversion.append((index, media_file, name, error_message))
                     else:
-                        results.append({
-                            'file': os.path.basename(media_file),
+                        # Other types of errors or already converted files
+                        results[index] = {
+                            'file': name,
+                            'path': media_file,
+                            'error': error_message
+                        }
+
+                # Convert all unreadable files of this batch in parallel
+                converted_files = executor.map(convert_audio_format, [m for _, m, _, _ in needs_conversion])
+
+                for (index, media_file, name, error_message), converted_input in zip(needs_conversion, converted_files):
+                    if converted_input is None:
+                        results[index] = {
+                            'file': name,
                             'path': media_file,
                             'error': f'Format conversion failed: {error_message}'
-                        })
-                else:
-                    # Other types of errors or already converted files
-                    results.append({
-                        'file': os.path.basename(media_file),
-                        'path': media_file,
-                        'error': error_message
-                    })
+                        }
+                        continue
+
+                    # Retry prediction with converted audio
+                    metrics, retry_error = run_prediction(predictor, converted_input)
+                    if metrics is not None:
+                        progress_bar.write(f"✓ Successfully processed {name} after format conversion")
+                        results[index] = {
+                            'file': name,
+                            'path': media_file,
+                            'metrics': metrics
+                        }
+                    else:
+                        progress_bar.write(f"✗ Error processing converted audio for {name}: {retry_error}")
+                        results[index] = {
+                            'file': name,
+                            'path': media_file,
+                            'error': f'Failed after format conversion: {retry_error}'
+                        }
+
+            progress_bar.update(len(batch_indices))
 
         # Close progress bar
         progress_bar.close()
 
-        # Clean up temporary audio files
-        for temp_file in temp_audio_files:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+        # Build the whole report in memory and write it with a single call
+        lines = ["Audio File Aesthetics Metrics\n", "=" * 50 + "\n\n"]
+
+        for result in results:
+            lines.append(f"File: {result['file']}\nPath: {result['path']}\n")
+
+            if 'error' in result:
+                lines.append(f"Error: {result['error']}\n")
+            else:
+                metrics = result['metrics']
+                lines.append(
+                    "Metrics:\n"
+                    f"  Content Enjoyment (CE): {metrics.get('CE', 'N/A'):.3f}\n"
+                    f"  Content Usefulness (CU): {metrics.get('CU', 'N/A'):.3f}\n"
+                    f"  Production Complexity (PC): {metrics.get('PC', 'N/A'):.3f}\n"
+                    f"  Production Quality (PQ): {metrics.get('PQ', 'N/A'):.3f}\n"
+                )
+
+            lines.append("\n" + "-" * 30 + "\n\n")
 
         # Write results to file
-        with open(output_file, 'w') as f:
-            f.write("Audio File Aesthetics Metrics\n")
-            f.write("=" * 50 + "\n\n")
-
-            for result in results:
-                f.write(f"File: {result['file']}\n")
-                f.write(f"Path: {result['path']}\n")
-
-                if 'error' in result:
-                    f.write(f"Error: {result['error']}\n")
-                else:
-                    f.write("Metrics:\n")
-                    metrics = result['metrics']
-                    f.write(f"  Content Enjoyment (CE): {metrics.get('CE', 'N/A'):.3f}\n")
-                    f.write(f"  Content Usefulness (CU): {metrics.get('CU', 'N/A'):.3f}\n")
-                    f.write(f"  Production Complexity (PC): {metrics.get('PC', 'N/A'):.3f}\n")
-                    f.write(f"  Production Quality (PQ): {metrics.get('PQ', 'N/A'):.3f}\n")
-
-                f.write("\n" + "-" * 30 + "\n\n")
+        with open(output_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write("".join(lines))
 
         print(f"Results saved to: {output_file}")
         print(f"Processed {len(results)} files")
@@ -276,6 +437,8 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,10 +9,23 @@ UTMOSv2 achieved 1st place in 7/16 metrics at VoiceMOS Challenge 2024.
 import os
 import sys
 import argparse
+import atexit
+import contextlib
+import hashlib
+import importlib.metadata
+import inspect
+import itertools
+import shutil
+import sqlite3
+import tempfile
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, TextIO, Tuple, Union
 import warnings
 
+import soundfile
 import torch
 import torchaudio
 from tqdm import tqdm
@@ -27,121 +40,497 @@ except ImportError:
     print("pip install git+https://github.com/sarulab-speech/UTMOSv2.git")
     sys.exit(1)
 
+# FFmpeg prefix: never read stdin, only log errors
+FFMPEG_COMMAND = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error"]
+
+# Supported audio and video formats
+AUDIO_EXTENSIONS = frozenset({'.wav', '.flac', '.mp3', '.m4a', '.ogg', '.aac', '.wma', '.aiff', '.au'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v'})
+SUPPORTED_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+
+# UTMOSv2 runs on CPU to avoid CUDA issues in containers
+PREDICT_DEVICE = 'cpu'
+
+# Number of files converted ahead of inference
+PREFETCH_SIZE = 8
+
+# Threads running FFmpeg conversions; half the cores leaves the rest to the model
+PREPARE_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# Read size when hashing files for the MOS cache
+CACHE_HASH_CHUNK_SIZE = 1 << 20
+
+# Default location of the MOS cache
+DEFAULT_CACHE_PATH = Path("~/.cache/utmosv2_mos.sqlite").expanduser()
+
+# Maximum MOS difference between the scripted and eager model before falling back
+SCRIPTED_MOS_TOLERANCE = 1e-3
+
+# Maximum MOS difference between the int8 and FP32 model before falling back
+QUANTIZED_MOS_TOLERANCE = 0.05
+
+
+def configure_cpu_inference() -> None:
+    """Set process-wide PyTorch options for CPU-only inference.
+
+    Must run before any model work: the inter-op pool size can only be set
+    before it is first used.
+    """
+    torch.set_grad_enabled(False)
+    torch.set_num_threads(os.cpu_count() or 1)
+    try:
+        # Intra-op threads do the work; one inter-op thread avoids oversubscription
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+
+
+class MosSummary:
+    """Running MOS statistics, updated as results are written."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def add(self, mos: float) -> None:
+        """Include one MOS score in the statistics."""
+        self.count += 1
+        self.total += mos
+        self.min = min(self.min, mos)
+        self.max = max(self.max, mos)
+
 
 class UTMOSv2Processor:
     """UTMOSv2 speech quality assessment processor."""
 
-    def __init__(self):
-        """Initialize UTMOSv2 model."""
+    def __init__(
+        self,
+        compile_model: bool = False,
+        script_model: bool = False,
+        quantize: bool = False,
+        cache_path: Optional[Path] = None
+    ):
+        """Initialize UTMOSv2 model.
+
+        Args:
+            compile_model: Compile the model's forward pass with torch.compile.
+            script_model: Run the model's forward pass as a frozen TorchScript module.
+            quantize: Use int8 dynamic quantization for Linear/LSTM layers on CPU.
+            cache_path: SQLite file caching MOS scores by file content. Caching is disabled if None.
+        """
+        # One temporary directory for the processor's lifetime, removed at exit
+        self._tmpdir = Path(tempfile.mkdtemp(prefix="utmosv2_"))
+        atexit.register(shutil.rmtree, self._tmpdir, ignore_errors=True)
+
         print("Loading UTMOSv2 model...")
         try:
             # UTMOSv2 handles device selection internally
             self.model = utmosv2.create_model(pretrained=True)
             print("✅ UTMOSv2 model loaded successfully")
+
+            # Place the model and resolve predict once instead of on every file
+            if isinstance(self.model, torch.nn.Module):
+                self.model.to(PREDICT_DEVICE)
+            self._predict = self.model.predict
         except Exception as e:
             print(f"❌ Failed to load UTMOSv2 model: {e}")
             print("💡 Make sure UTMOSv2 is installed: pip install git+https://github.com/sarulab-speech/UTMOSv2.git")
             raise
 
+        # Identifies the scoring model in cache keys, so scores from other versions are not reused
+        try:
+            self._model_tag = f"utmosv2-{importlib.metadata.version('utmosv2')}"
+        except importlib.metadata.PackageNotFoundError:
+            self._model_tag = f"utmosv2-{getattr(utmosv2, '__version__', 'unknown')}"
+
+        if quantize:
+            self._quantize_model()
+
+        if script_model:
+            self._script_model()
+
+        if compile_model:
+            self._compile_model()
+
+        self._cache = None
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache = sqlite3.connect(str(cache_path))
+            self._cache.execute("CREATE TABLE IF NOT EXISTS mos_cache (key TEXT PRIMARY KEY, mos REAL)")
+            # Content digests by path, reused while a file's size and mtime are unchanged
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS file_index "
+                "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT)"
+            )
+            print(f"Caching MOS scores in: {cache_path}")
+
+        # Newer UTMOSv2 releases score in-memory waveforms via predict(data=..., sr=...)
+        try:
+            self._predict_accepts_data = "data" in inspect.signature(self._predict).parameters
+        except (TypeError, ValueError):
+            self._predict_accepts_data = False
+
+    def _cache_key(self, file_path: Path) -> str:
+        """Get the MOS cache key for a file: a hash of its contents plus the model tag.
+
+        The file is only read when its size or mtime differs from the indexed
+        entry; otherwise the stored digest is reused. Index updates are left
+        uncommitted for the caller to commit in one transaction.
+        """
+        stat = file_path.stat()
+        path = str(file_path.resolve())
+        row = self._cache.execute(
+            "SELECT digest FROM file_index WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, stat.st_size, stat.st_mtime_ns)
+        ).fetchone()
+        if row:
+            return f"{row[0]}|{self._model_tag}"
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CACHE_HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        self._cache.execute(
+            "INSERT OR REPLACE INTO file_index (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+            (path, stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+        )
+        return f"{digest.hexdigest()}|{self._model_tag}"
+
+    def _cached_mos(self, key: str) -> Optional[float]:
+        """Look up a cached MOS score."""
+        row = self._cache.execute("SELECT mos FROM mos_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _store_mos(self, key: str, mos: float) -> None:
+        """Save a MOS score to the cache."""
+        with self._cache:
+            self._cache.execute("INSERT OR REPLACE INTO mos_cache (key, mos) VALUES (?, ?)", (key, mos))
+
+    def _run_predict(self, **kwargs):
+        """Call UTMOSv2 predict without autograd or tensor version bookkeeping."""
+        with torch.inference_mode():
+            return self._predict(**kwargs)
+
+    def _score_silence(self) -> float:
+        """Predict the MOS of one second of silence, used to warm up and check the model."""
+        silence_path = self._temp_wav_path()
+        try:
+            torchaudio.save(str(silence_path), torch.zeros(1, 16000), 16000)
+            return float(self._run_predict(input_path=str(silence_path), device=PREDICT_DEVICE))
+        finally:
+            silence_path.unlink(missing_ok=True)
+
+    def _temp_wav_path(self) -> Path:
+        """Get a unique path for a temporary WAV in the processor's temp directory."""
+        return self._tmpdir / f"{uuid.uuid4().hex}.wav"
+
+    def _quantize_model(self) -> None:
+        """Swap in an int8 dynamically quantized copy of the model if it reproduces FP32 scores."""
+        if not isinstance(self.model, torch.nn.Module):
+            print("⚠️  UTMOSv2 model is not a torch module, skipping quantization")
+            return
+
+        fp32_model, fp32_predict = self.model, self._predict
+        try:
+            print("Quantizing UTMOSv2 model to int8...")
+            self.model.eval()
+            fp32_score = self._score_silence()
+
+            # Quantizes a copy, so the FP32 model stays usable if the check fails
+            quantized = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+            )
+
+            self.model, self._predict = quantized, quantized.predict
+            if abs(self._score_silence() - fp32_score) > QUANTIZED_MOS_TOLERANCE:
+                self.model, self._predict = fp32_model, fp32_predict
+                print("⚠️  Quantized scores differ from FP32, using FP32 model")
+                return
+
+            self._model_tag += "-int8"
+            print("✅ UTMOSv2 model quantized")
+
+        except Exception as e:
+            print(f"⚠️  Quantization failed, using FP32 model: {e}")
+            self.model, self._predict = fp32_model, fp32_predict
+
+    def _script_model(self) -> None:
+        """Replace the model's forward with a frozen TorchScript version if it reproduces eager scores."""
+        if not isinstance(self.model, torch.nn.Module):
+            print("⚠️  UTMOSv2 model is not a torch module, skipping TorchScript")
+            return
+
+        try:
+            print("Scripting UTMOSv2 model...")
+            self.model.eval()
+            eager_score = self._score_silence()
+
+            scripted = torch.jit.optimize_for_inference(torch.jit.freeze(torch.jit.script(self.model)))
+
+            # predict() calls the module, which dispatches to this instance attribute
+            self.model.forward = scripted.forward
+            if abs(self._score_silence() - eager_score) > SCRIPTED_MOS_TOLERANCE:
+                raise ValueError("scripted model scores differ from the eager model")
+
+            print("✅ UTMOSv2 model scripted")
+
+        except Exception as e:
+            print(f"⚠️  TorchScript failed, using eager model: {e}")
+            self.model.__dict__.pop("forward", None)
+
+    def _compile_model(self) -> None:
+        """Compile the model in place, keeping the eager model on failure."""
+        # nn.Module.compile keeps predict() bound to the module while compiling its forward
+        if not isinstance(self.model, torch.nn.Module) or not hasattr(self.model, "compile"):
+            print("⚠️  In-place torch.compile is not available for this model/PyTorch version, skipping compilation")
+            return
+
+        try:
+            print("Compiling UTMOSv2 model...")
+            # Default mode: "reduce-overhead" only adds CUDA graphs, and prediction runs on CPU
+            self.model.compile(fullgraph=False)
+
+            # Warm up so compilation happens here rather than on the first file
+            self._score_silence()
+
+            print("✅ UTMOSv2 model compiled")
+
+        except Exception as e:
+            print(f"⚠️  Model compilation failed, using eager model: {e}")
+            # nn.Module.compile only sets this attribute; clearing it restores eager calls
+            self.model._compiled_call_impl = None
 
     def _extract_audio_from_video(self, file_path: Path) -> Optional[Path]:
         """Extract audio from video file using FFmpeg."""
         try:
             import subprocess
 
-            # Create temporary audio file in writable /tmp directory
-            import tempfile
-            temp_audio = Path(tempfile.mkdtemp()) / f"{file_path.stem}_temp_audio.wav"
+            # Unique name, as several files are converted at once
+            temp_audio = self._temp_wav_path()
 
             print(f"🎥 Extracting audio from video: {file_path.name}")
 
             # Use FFmpeg to extract audio (16kHz mono WAV for UTMOSv2)
-            cmd = [
-                "ffmpeg", "-i", str(file_path),
+            cmd = FFMPEG_COMMAND + [
+                "-i", str(file_path),
                 "-vn", "-acodec", "pcm_s16le", "-ar", "16000",
                 "-ac", "1", "-y", str(temp_audio)
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # With -loglevel error, stderr only ever holds the failure message
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors='replace'
+            )
 
             if result.returncode == 0:
                 print(f"✅ Successfully extracted audio from {file_path.name}")
                 return temp_audio
             else:
                 print(f"❌ Failed to extract audio from {file_path.name}")
+                print(f"❌ FFmpeg stderr: {result.stderr}")
+                if temp_audio.exists():
+                    temp_audio.unlink()
                 return None
 
         except Exception as e:
             print(f"❌ Error extracting audio from {file_path.name}: {e}")
             return None
 
+    def _load_in_process(self, file_path: Path) -> Optional[torch.Tensor]:
+        """Load a 16kHz audio file with libsndfile as a mono waveform, or None if unsupported.
+
+        Covers WAV/FLAC/OGG/AIFF/AU (and MP3 with libsndfile >= 1.1) without
+        starting an FFmpeg process. Files at other rates are not resampled
+        here, so their scores come from UTMOSv2's own loader and resampler.
+        """
+        try:
+            with soundfile.SoundFile(str(file_path)) as f:
+                if f.samplerate != 16000:
+                    return None
+                data = f.read(dtype='float32', always_2d=True)
+        except Exception:
+            return None
+
+        return torch.from_numpy(data).mean(dim=1)
+
     def _convert_audio_format(self, file_path: Path) -> Optional[Path]:
-        """Convert audio to WAV format using FFmpeg."""
+        """Convert audio to WAV format, in process when libsndfile reads it at 16kHz, else with FFmpeg."""
         try:
             import subprocess
 
-            # Create temporary WAV file in writable /tmp directory
-            import tempfile
-            temp_wav = Path(tempfile.mkdtemp()) / f"{file_path.stem}_temp_converted.wav"
+            # Unique name, as several files are converted at once
+            temp_wav = self._temp_wav_path()
 
             print(f"🔄 Converting audio format: {file_path.name}")
 
+            waveform = self._load_in_process(file_path)
+            if waveform is not None:
+                soundfile.write(str(temp_wav), waveform.numpy(), 16000, subtype='PCM_16')
+                print(f"✅ Successfully converted {file_path.name}")
+                return temp_wav
+
             # Use FFmpeg to convert to 16kHz mono WAV
-            cmd = [
-                "ffmpeg", "-i", str(file_path),
+            cmd = FFMPEG_COMMAND + [
+                "-i", str(file_path),
                 "-acodec", "pcm_s16le", "-ar", "16000",
                 "-ac", "1", "-y", str(temp_wav)
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # With -loglevel error, stderr only ever holds the failure message
+            result = subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors='replace'
+            )
 
             if result.returncode == 0:
                 print(f"✅ Successfully converted {file_path.name}")
                 return temp_wav
             else:
                 print(f"❌ Failed to convert {file_path.name}")
-                print(f"❌ FFmpeg stdout: {result.stdout}")
                 print(f"❌ FFmpeg stderr: {result.stderr}")
+                if temp_wav.exists():
+                    temp_wav.unlink()
                 return None
 
         except Exception as e:
             print(f"❌ Error converting {file_path.name}: {e}")
             return None
 
-    def process_file(self, file_path: Path) -> Optional[dict]:
-        """Process a single file and return UTMOSv2 MOS score."""
-        print(f"🔍 Processing: {file_path.name}")
+    def _decode_to_memory(self, file_path: Path) -> Optional[torch.Tensor]:
+        """Decode audio from any FFmpeg-readable file straight into a 16kHz mono waveform."""
+        try:
+            import subprocess
 
-        # Check if it's a video file
-        video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v'}
-        audio_extensions = {'.wav', '.flac', '.mp3', '.m4a', '.ogg', '.aac', '.wma', '.aiff', '.au'}
-        temp_file_path = None
+            print(f"🔄 Decoding audio in memory: {file_path.name}")
 
-        if file_path.suffix.lower() in video_extensions:
-            temp_file_path = self._extract_audio_from_video(file_path)
-            if temp_file_path is None:
+            # Raw 16kHz mono PCM on stdout, no WAV file or container
+            cmd = FFMPEG_COMMAND + [
+                "-i", str(file_path),
+                "-vn", "-f", "s16le", "-acodec", "pcm_s16le", "-ar", "16000",
+                "-ac", "1", "pipe:1"
+            ]
+
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            raw, _ = process.communicate()
+
+            if process.returncode == 0 and raw:
+                print(f"✅ Successfully decoded {file_path.name}")
+                return torch.frombuffer(bytearray(raw), dtype=torch.int16).float().div_(32768.0)
+            else:
+                print(f"❌ Failed to decode {file_path.name}")
                 return None
-            processing_path = temp_file_path
-        elif file_path.suffix.lower() in audio_extensions:
-            # Convert to WAV if not already WAV (UTMOSv2 expects WAV files)
-            if file_path.suffix.lower() != '.wav':
+
+        except Exception as e:
+            print(f"❌ Error decoding {file_path.name}: {e}")
+            return None
+
+    def _prepare_input(self, file_path: Path) -> Tuple[Union[Path, torch.Tensor, None], Optional[Path]]:
+        """Get model input for a media file, decoding in memory when predict() accepts waveforms.
+
+        Returns (processing_input, temp_file_path) like _prepare_wav, where
+        processing_input is either a file path or a 16kHz mono waveform.
+        """
+        if not self._predict_accepts_data:
+            return self._prepare_wav(file_path)
+
+        # 16kHz files need no resampling, so decoding them here cannot change their scores
+        waveform = self._load_in_process(file_path)
+        if waveform is not None:
+            return waveform, None
+
+        # Other rates are resampled by UTMOSv2's own loader, keeping MOS identical to a direct predict()
+        if file_path.suffix.lower() in AUDIO_EXTENSIONS and self._is_natively_readable(file_path):
+            return file_path, None
+
+        # FFmpeg only starts for video and formats libsndfile cannot read
+        return self._decode_to_memory(file_path), None
+
+    def _is_natively_readable(self, file_path: Path) -> bool:
+        """Check whether UTMOSv2's libsndfile-based loader can read this file.
+
+        Decided per file from its header with soundfile.info, so one corrupt or
+        unusual file does not decide the route for every file of its type.
+        """
+        try:
+            soundfile.info(str(file_path))
+            return True
+        except Exception:
+            return False
+
+    def _prepare_wav(self, file_path: Path) -> Tuple[Optional[Path], Optional[Path]]:
+        """Get a file UTMOSv2 can read for a media file.
+
+        Returns (processing_path, temp_file_path). processing_path is None if the
+        file could not be prepared; temp_file_path is set when a temporary WAV
+        was created, which the caller must delete.
+        """
+        # Check if it's a video file
+        if file_path.suffix.lower() in VIDEO_EXTENSIONS:
+            temp_file_path = self._extract_audio_from_video(file_path)
+            return temp_file_path, temp_file_path
+        elif file_path.suffix.lower() in AUDIO_EXTENSIONS:
+            # Convert only formats UTMOSv2's loader cannot read directly (e.g. WMA, AAC)
+            if file_path.suffix.lower() != '.wav' and not self._is_natively_readable(file_path):
                 temp_file_path = self._convert_audio_format(file_path)
-                if temp_file_path is None:
-                    return None
-                processing_path = temp_file_path
-            else:
-                processing_path = file_path
+                return temp_file_path, temp_file_path
+            return file_path, None
         else:
             print(f"❌ Unsupported file format: {file_path.suffix}")
+            return None, None
+
+    def process_file(self, file_path: Path) -> Optional[dict]:
+        """Process a single file and return UTMOSv2 MOS score."""
+        print(f"🔍 Processing: {file_path.name}")
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache_key(file_path)
+            mos = self._cached_mos(cache_key)
+            if mos is not None:
+                print(f"♻️  Using cached MOS for {file_path.name} (MOS: {mos:.3f})")
+                return {'file_path': str(file_path), 'mos': mos}
+
+        processing_input, temp_file_path = self._prepare_input(file_path)
+        result = self._score_prepared(file_path, processing_input, temp_file_path)
+
+        if result and cache_key is not None:
+            self._store_mos(cache_key, result['mos'])
+        return result
+
+    def _score_prepared(
+        self,
+        file_path: Path,
+        processing_input: Union[Path, torch.Tensor, None],
+        temp_file_path: Optional[Path]
+    ) -> Optional[dict]:
+        """Predict the MOS of a prepared WAV or waveform and delete its temporary file."""
+        if processing_input is None:
             return None
 
         try:
-            # Use the correct UTMOSv2 API - predict method with input_path parameter
-            print(f"🔍 Predicting MOS for: {processing_path.name}")
+            print(f"🔍 Predicting MOS for: {file_path.name}")
 
-            # UTMOSv2 expects the predict method with input_path parameter
             # Force CPU usage by passing device parameter
-            mos_score = self.model.predict(input_path=str(processing_path), device='cpu')
+            if isinstance(processing_input, torch.Tensor):
+                mos_score = self._run_predict(data=processing_input.numpy(), sr=16000, device=PREDICT_DEVICE)
+            else:
+                mos_score = self._run_predict(input_path=str(processing_input), device=PREDICT_DEVICE)
 
             if mos_score is None:
                 print(f"❌ UTMOSv2 prediction returned None for {file_path.name}")
@@ -156,6 +545,14 @@ class UTMOSv2Processor:
             return result
 
         except Exception as e:
+            # A file passed through natively can still fail in UTMOSv2's loader; convert and retry once
+            if isinstance(processing_input, Path) and processing_input == file_path:
+                print(f"⚠️  UTMOSv2 could not read {file_path.name} directly, converting: {e}")
+                converted_path = self._convert_audio_format(file_path)
+                if converted_path is None:
+                    return None
+                return self._score_prepared(file_path, converted_path, converted_path)
+
             print(f"❌ Error processing {file_path.name}: {e}")
             # Print more detailed error information for debugging
             import traceback
@@ -167,20 +564,116 @@ class UTMOSv2Processor:
             if temp_file_path and temp_file_path.exists():
                 temp_file_path.unlink()
 
-    def process_directory(self, input_dir: Path, output_file: Path) -> None:
-        """Process all supported audio/video files in a directory."""
-        # Supported extensions
-        audio_extensions = {'.wav', '.flac', '.mp3', '.m4a', '.ogg', '.aac', '.wma', '.aiff', '.au'}
-        video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v'}
-        supported_extensions = audio_extensions | video_extensions
+    def _iter_prepared(
+        self,
+        media_files: List[Path],
+        prefetch: int = PREFETCH_SIZE,
+        in_memory: bool = False
+    ) -> Iterator[Tuple[Path, Union[Path, torch.Tensor, None], Optional[Path]]]:
+        """Yield (file_path, processing_input, temp_file_path) in order, preparing files ahead.
+
+        With in_memory=True files are prepared with _prepare_input, otherwise
+        as WAV files with _prepare_wav.
+
+        FFmpeg conversions run in a thread pool for up to prefetch files
+        ahead, so decoding overlaps with inference on the current file. Each
+        FFmpeg call is its own process, so threads are enough to use every core.
+        """
+        def prepare(file_path: Path) -> Tuple[Union[Path, torch.Tensor, None], Optional[Path]]:
+            print(f"🔍 Processing: {file_path.name}")
+            return self._prepare_input(file_path) if in_memory else self._prepare_wav(file_path)
+
+        remaining = iter(media_files)
+        with ThreadPoolExecutor(max_workers=PREPARE_WORKERS) as pool:
+            in_flight = deque(
+                (file_path, pool.submit(prepare, file_path))
+                for file_path in itertools.islice(remaining, prefetch)
+            )
+
+            while in_flight:
+                file_path, future = in_flight.popleft()
+
+                # Keep the window full before waiting on the oldest file
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    in_flight.append((next_path, pool.submit(prepare, next_path)))
+
+                yield (file_path, *future.result())
+
+    def process_batch(self, file_paths: List[Path]) -> List[dict]:
+        """Process several files with a single batched UTMOSv2 call."""
+        return self._score_batch(list(self._iter_prepared(file_paths)))
+
+    def _score_batch(self, prepared: List[Tuple[Path, Optional[Path], Optional[Path]]]) -> List[dict]:
+        """Score prepared files with one batched UTMOSv2 call.
+
+        The prepared files are linked into one directory under index-based
+        names that keep their real suffix and scored with predict(input_dir=...),
+        which runs the model on batches of len(prepared) files. Files the
+        batched call does not score, or all files if it fails, are scored on
+        their own. Results are returned in input order.
+        """
+        scores = {}  # index -> MOS
+        with tempfile.TemporaryDirectory(dir=self._tmpdir) as batch_dir:
+            try:
+                staged = []  # indices of files linked into batch_dir
+                for index, (_, processing_path, _) in enumerate(prepared):
+                    if processing_path is None:
+                        continue
+
+                    # Index-based names keep the real suffix, so the loader sees the true format
+                    link_name = f"{index:06d}{processing_path.suffix.lower()}"
+                    (Path(batch_dir) / link_name).symlink_to(processing_path.resolve())
+                    staged.append(index)
+
+                if staged:
+                    predictions = self._run_predict(
+                        input_dir=batch_dir,
+                        batch_size=len(staged),
+                        device=PREDICT_DEVICE
+                    )
+                    for prediction in predictions:
+                        scores[int(Path(prediction['file_path']).stem)] = float(prediction['predicted_mos'])
+
+                # Files the batched call skipped (e.g. formats it does not list) are scored on their own
+                for index in staged:
+                    if index not in scores:
+                        file_path, processing_path, _ = prepared[index]
+                        result = self._score_prepared(file_path, processing_path, None)
+                        if result:
+                            scores[index] = result['mos']
+
+            except Exception as e:
+                print(f"⚠️  Batched prediction failed, processing files one by one: {e}")
+                scores = {}
+                for index, (file_path, processing_path, _) in enumerate(prepared):
+                    result = self._score_prepared(file_path, processing_path, None)
+                    if result:
+                        scores[index] = result['mos']
+
+            finally:
+                # Clean up temporary files
+                for _, _, temp_file_path in prepared:
+                    if temp_file_path and temp_file_path.exists():
+                        temp_file_path.unlink()
 
-        # Find all supported files
-        media_files = []
-        for ext in supported_extensions:
-            media_files.extend(input_dir.glob(f"*{ext}"))
-            media_files.extend(input_dir.glob(f"*{ext.upper()}"))
-
-        media_files = sorted(set(media_files))
+        results = []
+        for index in sorted(scores):
+            file_path = prepared[index][0]
+            print(f"✅ Successfully processed {file_path.name} (MOS: {scores[index]:.3f})")
+            results.append({'file_path': str(file_path), 'mos': scores[index]})
+        return results
+
+    def process_directory(self, input_dir: Path, output_file: Path, batch_size: int = 1) -> None:
+        """Process all supported audio/video files in a directory.
+
+        With batch_size > 1, files are scored in groups of batch_size per model call.
+        """
+        # Single pass over the directory instead of one glob per extension
+        media_files = sorted(
+            p for p in input_dir.iterdir()
+            if p.suffix.lower() in SUPPORTED_EXTENSIONS and p.is_file()
+        )
 
         if not media_files:
             print("❌ No supported audio/video files found in the directory.")
@@ -188,51 +681,119 @@ class UTMOSv2Processor:
 
         print(f"Found {len(media_files)} media file(s) to process")
 
-        results = []
-
-        # Process files with progress bar
-        with tqdm(media_files, desc="Processing", unit="file") as pbar:
-            for file_path in pbar:
-                pbar.set_description(f"Processing: {file_path.name}")
+        # Files already scored by this model are taken from the cache and never decoded;
+        # unchanged files are matched by size and mtime, so only new or edited files are hashed
+        cached_results = deque()  # in file order
+        cache_keys = {}  # file_path -> cache key
+        if self._cache is not None:
+            pending_files = []
+            for file_path in media_files:
+                try:
+                    cache_keys[file_path] = self._cache_key(file_path)
+                except OSError:
+                    # Unreadable files go through the normal path and report their own error
+                    pending_files.append(file_path)
+                    continue
+
+                mos = self._cached_mos(cache_keys[file_path])
+                if mos is None:
+                    pending_files.append(file_path)
+                else:
+                    cached_results.append({'file_path': str(file_path), 'mos': mos})
+            self._cache.commit()
+
+            if cached_results:
+                print(f"♻️  Using cached MOS for {len(cached_results)} file(s)")
+            media_files = pending_files
+
+        # Files are converted ahead on worker threads while the model scores earlier ones
+        # Batches are scored from a directory of WAVs, single files can be decoded in memory
+        prepared_files = self._iter_prepared(
+            media_files,
+            prefetch=max(PREFETCH_SIZE, batch_size),
+            in_memory=batch_size == 1
+        )
+
+        # Each result is written as soon as it is known, so an interrupted run keeps its work
+        summary = MosSummary()
+        with self._open_results(output_file, summary) as f:
+            def emit(new_results: List[dict]) -> None:
+                for result in new_results:
+                    # Cached scores that sort before this file go first, keeping file order
+                    while cached_results and cached_results[0]['file_path'] < result['file_path']:
+                        self._append_result(f, cached_results.popleft(), summary)
+                    self._append_result(f, result, summary)
+
+                    cache_key = cache_keys.get(Path(result['file_path']))
+                    if cache_key is not None:
+                        self._store_mos(cache_key, result['mos'])
+
+            if batch_size > 1:
+                # Process files in batches with progress bar
+                with tqdm(total=len(media_files), desc="Processing", unit="file") as pbar:
+                    while True:
+                        batch = list(itertools.islice(prepared_files, batch_size))
+                        if not batch:
+                            break
+                        emit(self._score_batch(batch))
+                        pbar.update(len(batch))
+            else:
+                # Process files with progress bar
+                with tqdm(prepared_files, total=len(media_files), desc="Processing", unit="file") as pbar:
+                    for file_path, processing_input, temp_file_path in pbar:
+                        # Drawn on tqdm's own refresh schedule rather than forcing a redraw per file
+                        pbar.set_postfix_str(file_path.name, refresh=False)
 
-                result = self.process_file(file_path)
-                if result:
-                    results.append(result)
+                        result = self._score_prepared(file_path, processing_input, temp_file_path)
+                        if result:
+                            emit([result])
 
-                pbar.set_description("Processing")
+            for result in cached_results:
+                self._append_result(f, result, summary)
 
-        # Write results
-        self._write_results(results, output_file)
         print(f"📝 Results saved to: {output_file}")
 
-    def _write_results(self, results: List[dict], output_file: Path) -> None:
-        """Write results to formatted text file."""
-        with open(output_file, 'w') as f:
-            f.write("Speech Quality Assessment Results (UTMOSv2)\n")
-            f.write("=" * 50 + "\n\n")
-
-            for result in results:
-                f.write(f"File: {Path(result['file_path']).name}\n")
-                f.write(f"Path: {result['file_path']}\n")
-                f.write("Speech Naturalness Metrics:\n")
-                f.write(f"  MOS (Mean Opinion Score): {result['mos']:.3f}\n")
-                f.write("\n" + "-" * 30 + "\n\n")
-
-            # Summary statistics
-            if results:
-                f.write("Summary Statistics:\n")
-                f.write("=" * 20 + "\n")
-                f.write(f"Total files processed: {len(results)}\n")
-
-                mos_avg = sum(r['mos'] for r in results) / len(results)
-                mos_min = min(r['mos'] for r in results)
-                mos_max = max(r['mos'] for r in results)
-
-                f.write(f"Average MOS: {mos_avg:.3f}\n")
-                f.write(f"Minimum MOS: {mos_min:.3f}\n")
-                f.write(f"Maximum MOS: {mos_max:.3f}\n")
-                f.write("\nNote: UTMOSv2 predicts naturalness of synthetic speech.\n")
-                f.write("Higher MOS scores indicate more natural-sounding speech.\n")
+    @contextlib.contextmanager
+    def _open_results(self, output_file: Path, summary: MosSummary) -> Iterator[TextIO]:
+        """Open the results file for incremental writing.
+
+        Writes the header on entry and the statistics collected in summary on
+        exit, also when processing is interrupted. Results are added with
+        _append_result, passing the same summary.
+        """
+        # Line buffered, so every finished result reaches the file immediately
+        with open(output_file, 'w', buffering=1) as f:
+            f.write(
+                "Speech Quality Assessment Results (UTMOSv2)\n"
+                + "=" * 50 + "\n\n"
+            )
+            try:
+                yield f
+            finally:
+                if summary.count:
+                    f.write(
+                        "Summary Statistics:\n"
+                        + "=" * 20 + "\n"
+                        f"Total files processed: {summary.count}\n"
+                        f"Average MOS: {summary.total / summary.count:.3f}\n"
+                        f"Minimum MOS: {summary.min:.3f}\n"
+                        f"Maximum MOS: {summary.max:.3f}\n"
+                        "\nNote: UTMOSv2 predicts naturalness of synthetic speech.\n"
+                        "Higher MOS scores indicate more natural-sounding speech.\n"
+                    )
+
+    def _append_result(self, f: TextIO, result: dict, summary: MosSummary) -> None:
+        """Write one result to a file opened with _open_results and add it to summary."""
+        file_path = result['file_path']
+        mos = result['mos']
+        f.write(
+            f"File: {Path(file_path).name}\n"
+            f"Path: {file_path}\n"
+            "Speech Naturalness Metrics:\n"
+            f"  MOS (Mean Opinion Score): {mos:.3f}\n"
+            "\n" + "-" * 30 + "\n\n"
+        )
+        summary.add(mos)
 
 
 def main():
@@ -240,6 +801,18 @@ def main():
     parser = argparse.ArgumentParser(description="UTMOSv2 Speech Quality Assessment")
     parser.add_argument("input_path", help="Input directory containing audio/video files")
     parser.add_argument("output_file", help="Output file for results")
+    optimization = parser.add_mutually_exclusive_group()
+    optimization.add_argument("--compile", action="store_true",
+                              help="Compile the model with torch.compile (slower startup, faster inference)")
+    optimization.add_argument("--script", action="store_true",
+                              help="Run the model as frozen TorchScript (faster CPU inference if scriptable)")
+    parser.add_argument("--quantize", action="store_true",
+                        help="Use int8 dynamic quantization for faster CPU inference")
+    parser.add_argument("--cache", type=Path, nargs="?", const=DEFAULT_CACHE_PATH, default=None,
+                        metavar="PATH",
+                        help=f"Reuse MOS scores of unchanged files across runs (default path: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="Score this many files per model call (default: 1, unbatched)")
 
     args = parser.parse_args()
 
@@ -256,8 +829,14 @@ def main():
 
     # Initialize processor and run
     try:
-        processor = UTMOSv2Processor()
-        processor.process_directory(input_path, output_file)
+        configure_cpu_inference()
+        processor = UTMOSv2Processor(
+            compile_model=args.compile,
+            script_model=args.script,
+            quantize=args.quantize,
+            cache_path=args.cache
+        )
+        processor.process_directory(input_path, output_file, batch_size=args.batch_size)
         print("🎉 Processing complete!")
 
     except KeyboardInterrupt:
@@ -59,6 +59,12 @@ setup(
             "mypy>=1.5.0",
             "pre-commit>=3.4.0",
         ],
+        "av": [
+            "av>=10.0.0",
+        ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
         "docs": [
             "sphinx>=7.1.0",
             "sphinx-rtd-theme>=1.3.0",
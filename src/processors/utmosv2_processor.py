@@ -20,11 +20,28 @@ Attributes:
     MAX_DURATION_SECONDS (float): Maximum recommended duration for processing.
 """
 
+import atexit
+import contextlib
+import copy
+import functools
+import hashlib
+import inspect
+import itertools
+import json
+import multiprocessing
+import os
+import shutil
+import struct
 import sys
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
+import soundfile as sf
 import torch
 import utmosv2
 from tqdm import tqdm
@@ -35,6 +52,49 @@ from utils.audio_utils import AudioProcessor, DeviceManager
 from utils.logging_utils import setup_logger, log_performance
 
 
+# Serializes predict() on the shared model, which moves itself between devices per call.
+# Reentrant so the device probe can hold it across its own predict() call.
+_model_lock = threading.RLock()
+
+# Device UTMOSv2 inference works on, by selected device type; probed once per process
+_probed_inference_devices: Dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_utmos_model() -> torch.nn.Module:
+    """Load the pretrained UTMOSv2 model once per process and keep it resident."""
+    return utmosv2.create_model(pretrained=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_scripted_utmos_model() -> torch.nn.Module:
+    """Build a frozen TorchScript variant of the shared model once per process.
+
+    Scripting works on a deep copy, so processors that use the eager model are
+    never switched to the scripted graph.
+    """
+    # predict() moves the shared model between devices, so copy it between calls
+    with _model_lock:
+        model = copy.deepcopy(_get_utmos_model())
+    model.eval()
+    scripted = torch.jit.optimize_for_inference(torch.jit.freeze(torch.jit.script(model)))
+    # predict() calls the module, which dispatches to this instance attribute
+    model.forward = scripted.forward
+    return model
+
+
+@functools.lru_cache(maxsize=1)
+def _get_device_manager() -> DeviceManager:
+    """Get the process-wide DeviceManager, probing devices only once."""
+    return DeviceManager()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_audio_processor(device: torch.device) -> AudioProcessor:
+    """Get the shared AudioProcessor for a device."""
+    return AudioProcessor(device)
+
+
 class UTMOSv2Processor:
     """Production-grade UTMOSv2 speech naturalness assessment processor.
 
@@ -59,13 +119,36 @@ class UTMOSv2Processor:
     SUPPORTED_SAMPLE_RATE = 16000
     MIN_DURATION_SECONDS = 0.5
     MAX_DURATION_SECONDS = 30.0
-
-    def __init__(self, device: Optional[torch.device] = None, force_cpu: bool = False) -> None:
+    TMPFS_DIR = Path("/dev/shm")
+    PREFETCH_SIZE = 8
+    PREPROCESS_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+    DEFAULT_WAVEFORM_CACHE_DIR = Path("~/.cache/audiobox/utmos").expanduser()
+    SCRIPT_WARMUP_RUNS = 3
+    WARMUP_DURATIONS_SECONDS = (1.0, 5.0, 15.0)
+    SCRIPTED_MOS_TOLERANCE = 1e-3
+    BF16_MOS_TOLERANCE = 0.05
+    WORKER_CHUNKSIZE = 8
+    PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        device: Optional[torch.device] = None,
+        force_cpu: bool = False,
+        waveform_cache_dir: Optional[Path] = None,
+        script_model: bool = False,
+        bf16: bool = False
+    ) -> None:
         """Initialize UTMOSv2 processor with model loading and device setup.
 
         Args:
             device: Specific device to use. Auto-detected if None.
             force_cpu: Force CPU usage even if GPU is available.
+            waveform_cache_dir: Directory for caching preprocessed 16kHz waveforms
+                across runs. Caching is disabled if None.
+            script_model: Run CPU inference through a frozen TorchScript graph,
+                falling back to the eager model if it fails or changes scores.
+            bf16: Run CPU inference under bfloat16 autocast, falling back to FP32
+                if scores drift beyond BF16_MOS_TOLERANCE.
 
         Raises:
             RuntimeError: If UTMOSv2 model fails to load.
@@ -74,19 +157,69 @@ class UTMOSv2Processor:
         self.logger = setup_logger(__name__)
 
         # Initialize device management
-        device_manager = DeviceManager()
         if force_cpu:
             self.device = torch.device("cpu")
         else:
-            self.device = device or device_manager.get_optimal_device()
+            self.device = device or _get_device_manager().get_optimal_device()
 
         self.logger.info("Initializing UTMOSv2 processor", device=str(self.device))
 
-        # Initialize audio processor
-        self.audio_processor = AudioProcessor(self.device)
+        # Settings that worker processes need to build an equivalent processor
+        self._worker_kwargs = {
+            "device": self.device,
+            "waveform_cache_dir": waveform_cache_dir,
+            "script_model": script_model,
+            "bf16": bf16
+        }
+
+        if self.device.type == "cpu":
+            self._configure_cpu_threads()
+
+        # Initialize audio processor. UTMOSv2 takes host memory (numpy or a WAV
+        # path), so waveforms stay on the CPU rather than round-tripping the GPU
+        self.audio_processor = _get_audio_processor(torch.device("cpu"))
+
+        # One scratch WAV per processor, on tmpfs when available, reused for every file
+        temp_root = self.TMPFS_DIR if self.TMPFS_DIR.is_dir() else None
+        self._temp_dir = Path(tempfile.mkdtemp(prefix="utmosv2_", dir=temp_root))
+        atexit.register(shutil.rmtree, self._temp_dir, ignore_errors=True)
+        self._temp_wav_path = self._temp_dir / "utmosv2_input.wav"
+        self._temp_wav_lock = threading.Lock()
+
+        # 44-byte RIFF header for 16kHz mono 16-bit PCM; only the two size fields change per file
+        self._wav_header_template = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 0, b'WAVE',
+            b'fmt ', 16, 1, 1, self.SUPPORTED_SAMPLE_RATE, self.SUPPORTED_SAMPLE_RATE * 2, 2, 16,
+            b'data', 0
+        )
+
+        self.waveform_cache_dir = waveform_cache_dir
+        if waveform_cache_dir is not None:
+            waveform_cache_dir.mkdir(parents=True, exist_ok=True)
+            self.logger.info("Waveform cache enabled", cache_dir=str(waveform_cache_dir))
 
         # Load UTMOSv2 model
+        self._autocast_dtype: Optional[torch.dtype] = None
         self._load_model()
+        if script_model:
+            self._script_model()
+        if bf16:
+            self._enable_bf16()
+        if script_model or bf16:
+            self._warm_up()
+
+    def _configure_cpu_threads(self) -> None:
+        """Give intra-op parallelism every core and use a single inter-op thread.
+
+        The inter-op pool size can only be set before it is first used, so this
+        runs before the model is loaded and is skipped if PyTorch already started it.
+        """
+        torch.set_num_threads(os.cpu_count() or 1)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            self.logger.debug("Inter-op thread pool already started, leaving its size")
 
     def _load_model(self) -> None:
         """Load and initialize UTMOSv2 model.
@@ -96,9 +229,26 @@ class UTMOSv2Processor:
             ImportError: If UTMOSv2 is not properly installed.
         """
         try:
+            # Every processor in the process shares one resident model
             self.logger.info("Loading UTMOSv2 model...")
-            self.model = utmosv2.create_model(pretrained=True)
-            self.logger.info("UTMOSv2 model loaded successfully")
+            self.model = _get_utmos_model()
+
+            # Resolve predict once instead of on every file
+            self._predict = self.model.predict
+
+            # Newer UTMOSv2 releases score in-memory waveforms, which skips the WAV round-trip
+            try:
+                self._predict_accepts_data = "data" in inspect.signature(self._predict).parameters
+            except (TypeError, ValueError):
+                self._predict_accepts_data = False
+
+            self._inference_device = self._probe_inference_device()
+
+            self.logger.info(
+                "UTMOSv2 model loaded successfully",
+                in_memory_input=self._predict_accepts_data,
+                inference_device=self._inference_device
+            )
 
         except ImportError as e:
             error_msg = ("UTMOSv2 package not found. Install with: "
@@ -110,6 +260,164 @@ class UTMOSv2Processor:
             self.logger.error("UTMOSv2 model loading failed", error=str(e))
             raise RuntimeError(f"Failed to load UTMOSv2 model: {e}") from e
 
+    def _probe_inference_device(self) -> str:
+        """Find the device UTMOSv2 inference actually works on.
+
+        Runs one prediction on a second of silence on the selected device and
+        falls back to CPU if it fails (e.g. CUDA visible but unusable inside a
+        container). The result is cached next to the shared model, so the probe
+        runs once per process per device type.
+
+        Returns:
+            Device string to pass to UTMOSv2 predict().
+        """
+        device = self.device.type
+        if device == "cpu":
+            return device
+
+        with _model_lock:
+            probed = _probed_inference_devices.get(device)
+            if probed is not None:
+                return probed
+
+            try:
+                self._score_silence(device)
+                probed = device
+            except Exception as e:
+                self.logger.warning(
+                    "UTMOSv2 inference failed on selected device, falling back to CPU",
+                    device=device,
+                    error=str(e)
+                )
+                probed = "cpu"
+
+            _probed_inference_devices[device] = probed
+            return probed
+
+    def _score_silence(self, device: Optional[str] = None, duration_seconds: float = 1.0) -> float:
+        """Predict the MOS of a clip of silence.
+
+        Used to probe devices, warm up the model and check optimized variants
+        against the eager model.
+
+        Args:
+            device: Device string for predict(). Defaults to the inference device.
+            duration_seconds: Length of the silent clip.
+
+        Returns:
+            Predicted MOS score.
+
+        Raises:
+            RuntimeError: If the probe WAV cannot be written.
+        """
+        device = device or self._inference_device
+        silence = torch.zeros(1, int(duration_seconds * self.SUPPORTED_SAMPLE_RATE))
+
+        if self._predict_accepts_data:
+            return float(self._run_predict(data=silence.squeeze(0).numpy(), sr=self.SUPPORTED_SAMPLE_RATE, device=device))
+
+        with self._temp_wav_lock:
+            temp_path = self._create_temp_wav(silence, self.SUPPORTED_SAMPLE_RATE)
+            if temp_path is None:
+                raise RuntimeError("Could not write silence WAV")
+            return float(self._run_predict(input_path=str(temp_path), device=device))
+
+    def _warm_up(self) -> None:
+        """Run predictions at representative input lengths before the first real file.
+
+        TorchScript's profiling executor and autocast kernel selection specialize
+        on the shapes they see, and the first calls at a new length can be orders
+        of magnitude slower than steady state. Paying that here keeps it off
+        the first files' latency.
+        """
+        for duration_seconds in self.WARMUP_DURATIONS_SECONDS:
+            try:
+                self._score_silence(duration_seconds=duration_seconds)
+            except Exception as e:
+                self.logger.warning("UTMOSv2 warm-up failed", duration=duration_seconds, error=str(e))
+                return
+
+        self.logger.info("UTMOSv2 model warmed up", durations=list(self.WARMUP_DURATIONS_SECONDS))
+
+    def _inference_context(self) -> contextlib.AbstractContextManager:
+        """Get the autocast context for predictions, a no-op unless bf16 is enabled."""
+        if self._autocast_dtype is None:
+            return contextlib.nullcontext()
+        return torch.autocast(device_type="cpu", dtype=self._autocast_dtype)
+
+    def _run_predict(self, **kwargs) -> float:
+        """Call UTMOSv2 predict() without autograd and under the configured autocast.
+
+        Args:
+            **kwargs: Arguments forwarded to predict().
+
+        Returns:
+            Raw predict() result.
+        """
+        with _model_lock, torch.inference_mode(), self._inference_context():
+            return self._predict(**kwargs)
+
+    def _enable_bf16(self) -> None:
+        """Switch CPU inference to bfloat16 autocast if it reproduces FP32 scores.
+
+        bfloat16 halves activation memory traffic and uses AMX/AVX-512 BF16 kernels
+        through oneDNN where the CPU has them.
+        """
+        if self._inference_device != "cpu":
+            self.logger.info("Skipping bfloat16 autocast, inference is not on CPU", device=self._inference_device)
+            return
+
+        try:
+            fp32_score = self._score_silence()
+            self._autocast_dtype = torch.bfloat16
+            bf16_score = self._score_silence()
+
+            if abs(bf16_score - fp32_score) > self.BF16_MOS_TOLERANCE:
+                raise ValueError(f"bfloat16 MOS differs from FP32 by {abs(bf16_score - fp32_score):.3f}")
+
+            self.logger.info("bfloat16 autocast enabled", fp32_mos=fp32_score, bf16_mos=bf16_score)
+
+        except Exception as e:
+            self.logger.warning("bfloat16 autocast unavailable, using FP32", error=str(e))
+            self._autocast_dtype = None
+
+    def _script_model(self) -> None:
+        """Switch this processor to a frozen, inference-optimized TorchScript copy of the model.
+
+        Only applied for CPU inference, where eager Python dispatch overhead matters
+        most. The scripted model must reproduce the eager score on a probe input;
+        otherwise, or if scripting fails, the eager model is kept. Warm-up runs
+        happen here so the profiling executor's specialization cost is not paid by
+        the first real file.
+        """
+        if self._inference_device != "cpu":
+            self.logger.info("Skipping TorchScript, inference is not on CPU", device=self._inference_device)
+            return
+
+        if not isinstance(self.model, torch.nn.Module):
+            self.logger.warning("UTMOSv2 model is not a torch module, skipping TorchScript")
+            return
+
+        try:
+            self.logger.info("Scripting UTMOSv2 model...")
+            eager_score = self._score_silence()
+
+            # Only this processor switches to the scripted copy; the shared eager model is untouched
+            self.model = _get_scripted_utmos_model()
+            self._predict = self.model.predict
+            for _ in range(self.SCRIPT_WARMUP_RUNS):
+                scripted_score = self._score_silence()
+
+            if abs(scripted_score - eager_score) > self.SCRIPTED_MOS_TOLERANCE:
+                raise ValueError("scripted model scores differ from the eager model")
+
+            self.logger.info("UTMOSv2 model scripted", warmup_runs=self.SCRIPT_WARMUP_RUNS)
+
+        except Exception as e:
+            self.logger.warning("TorchScript failed, using eager model", error=str(e))
+            self.model = _get_utmos_model()
+            self._predict = self.model.predict
+
     @log_performance
     def process_file(self, file_path: Path) -> Optional[Dict[str, Union[str, float]]]:
         """Process single audio file for speech naturalness assessment.
@@ -123,27 +431,158 @@ class UTMOSv2Processor:
             - mos: Mean Opinion Score for naturalness (1.0-5.0)
             - duration_seconds: Audio duration in seconds
             - sample_rate: Audio sample rate used
+            Files shorter than MIN_DURATION_SECONDS get a result with file_path,
+            duration_seconds and an error instead of a score.
             None if processing fails.
 
         Example:
             >>> processor = UTMOSv2Processor()
             >>> result = processor.process_file(Path("speech.wav"))
-            >>> if result:
+            >>> if result and "mos" in result:
             ...     print(f"Naturalness MOS: {result['mos']:.3f}")
         """
+        return self._score_waveform(file_path, self._preprocess(file_path))
+
+    def _preprocess(
+        self,
+        file_path: Path
+    ) -> Union[Tuple[torch.Tensor, int], Dict[str, Union[str, float]], None]:
+        """Load and preprocess a media file into a waveform at the model's sample rate.
+
+        For files libsndfile can open, the duration is read from the header
+        first, so files too short to assess are rejected without being decoded,
+        and the header is reused to validate the file. Other formats and videos
+        are checked after decoding rather than probed with ffprobe. Safe to call
+        from worker threads; it touches no per-processor scratch state.
+
+        Args:
+            file_path: Path to audio or video file to preprocess.
+
+        Returns:
+            Tuple of (waveform, sample_rate); an error result dictionary if the
+            file is shorter than MIN_DURATION_SECONDS; or None if preprocessing
+            failed.
+        """
         try:
             self.logger.info("Processing file for UTMOSv2 assessment", file=file_path.name)
 
+            header = self.audio_processor.read_header(file_path)
+            if header is not None:
+                num_frames, sample_rate = header
+                if sample_rate > 0 and num_frames / sample_rate < self.MIN_DURATION_SECONDS:
+                    return self._too_short_result(file_path, num_frames / sample_rate)
+
             # Validate and preprocess audio
-            audio_data = self.audio_processor.load_and_preprocess(
-                file_path,
-                target_sample_rate=self.SUPPORTED_SAMPLE_RATE
-            )
+            if self.waveform_cache_dir is not None:
+                audio_data = self._cached_preprocess(file_path, header)
+            else:
+                audio_data = self.audio_processor.load_and_preprocess(
+                    file_path,
+                    target_sample_rate=self.SUPPORTED_SAMPLE_RATE,
+                    header=header
+                )
 
             if audio_data is None:
                 self.logger.error("Audio preprocessing failed", file=file_path.name)
                 return None
 
+            if header is None:
+                waveform, sample_rate = audio_data
+                duration_seconds = waveform.shape[-1] / sample_rate
+                if duration_seconds < self.MIN_DURATION_SECONDS:
+                    return self._too_short_result(file_path, duration_seconds)
+            return audio_data
+
+        except Exception as e:
+            self.logger.error("UTMOSv2 processing failed", file=file_path.name, error=str(e))
+            return None
+
+    def _too_short_result(self, file_path: Path, duration_seconds: float) -> Dict[str, Union[str, float]]:
+        """Build the error result for a file too short to assess."""
+        self.logger.warning(
+            "Audio too short for reliable assessment, skipping",
+            file=file_path.name,
+            duration=duration_seconds,
+            minimum=self.MIN_DURATION_SECONDS
+        )
+        return {
+            'file_path': str(file_path),
+            'duration_seconds': float(duration_seconds),
+            'error': f"Too short ({duration_seconds:.2f}s < {self.MIN_DURATION_SECONDS}s)"
+        }
+
+    def _cached_preprocess(
+        self,
+        file_path: Path,
+        header: Optional[Tuple[int, int]] = None
+    ) -> Optional[Tuple[torch.Tensor, int]]:
+        """Preprocess a media file through the on-disk waveform cache.
+
+        Entries are keyed on the file's path, mtime, size and the target sample
+        rate, and stored as int16 .npy files, half the size of float32. A hit
+        skips decoding, FFmpeg conversion and resampling entirely.
+
+        Args:
+            file_path: Path to audio or video file to preprocess.
+            header: (num_frames, sample_rate) from read_header, if already read.
+
+        Returns:
+            Tuple of (waveform, sample_rate), or None if preprocessing failed.
+        """
+        stat = file_path.stat()
+        key = f"{file_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{self.SUPPORTED_SAMPLE_RATE}"
+        cache_path = self.waveform_cache_dir / f"{hashlib.blake2b(key.encode()).hexdigest()}.npy"
+
+        try:
+            pcm = np.load(cache_path, mmap_mode='r')
+            waveform = torch.from_numpy(pcm.astype(np.float32) / 32767.0).unsqueeze(0)
+            self.logger.debug("Waveform cache hit", file=file_path.name)
+            return waveform, self.SUPPORTED_SAMPLE_RATE
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning("Ignoring unreadable waveform cache entry", file=file_path.name, error=str(e))
+
+        audio_data = self.audio_processor.load_and_preprocess(
+            file_path,
+            target_sample_rate=self.SUPPORTED_SAMPLE_RATE,
+            header=header
+        )
+        if audio_data is None:
+            return None
+
+        waveform, sample_rate = audio_data
+        pcm = (waveform.squeeze(0).clamp(-1.0, 1.0) * 32767.0).round().to(torch.int16).cpu().numpy()
+        try:
+            # Write then rename, so concurrent runs never see a partial entry
+            partial_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(partial_path, 'wb') as f:
+                np.save(f, pcm)
+            os.replace(partial_path, cache_path)
+        except OSError as e:
+            self.logger.warning("Failed to write waveform cache entry", file=file_path.name, error=str(e))
+
+        return audio_data
+
+    def _score_waveform(
+        self,
+        file_path: Path,
+        audio_data: Union[Tuple[torch.Tensor, int], Dict[str, Union[str, float]], None]
+    ) -> Optional[Dict[str, Union[str, float]]]:
+        """Run UTMOSv2 on a preprocessed waveform.
+
+        Args:
+            file_path: Original file path, used for reporting.
+            audio_data: Output of _preprocess. Error results are passed through.
+
+        Returns:
+            Assessment result dictionary as returned by process_file, or None if
+            preprocessing or prediction failed.
+        """
+        if audio_data is None or isinstance(audio_data, dict):
+            return audio_data
+
+        try:
             waveform, sample_rate = audio_data
             duration_seconds = waveform.shape[-1] / sample_rate
 
@@ -164,50 +603,120 @@ class UTMOSv2Processor:
                     truncated_to=self.MAX_DURATION_SECONDS
                 )
 
-            # Create temporary WAV file for UTMOSv2 processing
-            temp_path = self._create_temp_wav(waveform, sample_rate)
-            if temp_path is None:
-                return None
-
-            try:
-                # Perform UTMOSv2 assessment
-                with torch.no_grad():
-                    mos_score = self.model.predict(
+            # Perform UTMOSv2 assessment
+            if self._predict_accepts_data:
+                mos_score = self._run_predict(
+                    data=waveform.squeeze(0).numpy(),
+                    sr=sample_rate,
+                    device=self._inference_device
+                )
+            else:
+                # Write to the processor's reusable WAV for path-only UTMOSv2 versions;
+                # the lock keeps concurrent calls from overwriting it mid-prediction
+                with self._temp_wav_lock:
+                    temp_path = self._create_temp_wav(waveform, sample_rate)
+                    if temp_path is None:
+                        return None
+
+                    mos_score = self._run_predict(
                         input_path=str(temp_path),
-                        device='cpu'  # Force CPU to avoid CUDA issues in containers
+                        device=self._inference_device
                     )
 
-                if mos_score is None:
-                    self.logger.error("UTMOSv2 returned None score", file=file_path.name)
-                    return None
-
-                result = {
-                    'file_path': str(file_path),
-                    'mos': float(mos_score),
-                    'duration_seconds': float(duration_seconds),
-                    'sample_rate': int(sample_rate)
-                }
+            if mos_score is None:
+                self.logger.error("UTMOSv2 returned None score", file=file_path.name)
+                return None
 
-                self.logger.info(
-                    "UTMOSv2 assessment completed",
-                    file=file_path.name,
-                    mos_score=float(mos_score),
-                    duration=float(duration_seconds)
-                )
+            result = {
+                'file_path': str(file_path),
+                'mos': float(mos_score),
+                'duration_seconds': float(duration_seconds),
+                'sample_rate': int(sample_rate)
+            }
 
-                return result
+            self.logger.info(
+                "UTMOSv2 assessment completed",
+                file=file_path.name,
+                mos_score=float(mos_score),
+                duration=float(duration_seconds)
+            )
 
-            finally:
-                # Clean up temporary file
-                if temp_path and temp_path.exists():
-                    temp_path.unlink()
+            return result
 
         except Exception as e:
             self.logger.error("UTMOSv2 processing failed", file=file_path.name, error=str(e))
             return None
 
+    def _iter_preprocessed(
+        self,
+        audio_files: List[Path]
+    ) -> Iterator[Tuple[Path, Union[Tuple[torch.Tensor, int], Dict[str, Union[str, float]], None]]]:
+        """Yield (file_path, audio_data) in order, preprocessing files ahead.
+
+        Decoding, FFmpeg conversion and resampling run in a thread pool for up
+        to PREFETCH_SIZE files ahead, so they overlap with inference on the
+        current file. FFmpeg runs as a subprocess and torch kernels release the
+        GIL, so threads are enough to keep the cores busy.
+
+        Args:
+            audio_files: Files to preprocess.
+
+        Yields:
+            Tuple of (file_path, audio_data), where audio_data is as returned
+            by _preprocess.
+        """
+        remaining = iter(audio_files)
+        with ThreadPoolExecutor(max_workers=self.PREPROCESS_WORKERS) as pool:
+            in_flight = deque(
+                (file_path, pool.submit(self._preprocess, file_path))
+                for file_path in itertools.islice(remaining, self.PREFETCH_SIZE)
+            )
+
+            while in_flight:
+                file_path, future = in_flight.popleft()
+
+                # Keep the window full before waiting on the oldest file
+                next_path = next(remaining, None)
+                if next_path is not None:
+                    in_flight.append((next_path, pool.submit(self._preprocess, next_path)))
+
+                yield file_path, future.result()
+
+    def _iter_scored_in_workers(
+        self,
+        audio_files: List[Path],
+        workers: int
+    ) -> Iterator[Tuple[Path, Optional[Dict[str, Union[str, float]]]]]:
+        """Yield (file_path, result) in order, scoring files in worker processes.
+
+        Each worker loads its own model once and gets an equal share of the CPU
+        threads, so short clips that cannot use every core inside one forward
+        pass still keep the machine busy. Workers are spawned rather than
+        forked, which is safe with CUDA and with threads already running here.
+
+        Args:
+            audio_files: Files to score.
+            workers: Number of worker processes.
+
+        Yields:
+            Tuple of (file_path, result), where result is as returned by process_file.
+        """
+        threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+        self.logger.info("Starting worker processes", workers=workers, threads_per_worker=threads_per_worker)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._worker_kwargs, threads_per_worker)
+        ) as pool:
+            yield from zip(audio_files, pool.map(_score_in_worker, audio_files, chunksize=self.WORKER_CHUNKSIZE))
+
     def _create_temp_wav(self, waveform: torch.Tensor, sample_rate: int) -> Optional[Path]:
-        """Create temporary WAV file for UTMOSv2 processing.
+        """Write waveform to the processor's reusable temporary WAV file.
+
+        The file lives in a per-processor directory (on /dev/shm when available)
+        that is removed at interpreter exit, and is overwritten on every call.
 
         Args:
             waveform: Audio tensor data.
@@ -217,33 +726,153 @@ class UTMOSv2Processor:
             Path to temporary WAV file, or None if creation failed.
         """
         try:
-            import torchaudio
-
-            temp_dir = Path(tempfile.mkdtemp())
-            temp_path = temp_dir / "utmosv2_input.wav"
-
-            # Save waveform as WAV file
-            torchaudio.save(str(temp_path), waveform.cpu(), sample_rate)
-
-            return temp_path
+            self._write_wav(self._temp_wav_path, waveform, sample_rate)
+            return self._temp_wav_path
 
         except Exception as e:
             self.logger.error("Failed to create temporary WAV file", error=str(e))
             return None
 
+    def _write_wav(self, path: Path, waveform: torch.Tensor, sample_rate: int) -> None:
+        """Write waveform to a 16-bit PCM WAV file.
+
+        Mono audio at the model's sample rate, the output of preprocessing, is
+        written directly from a precomputed RIFF header and the raw samples;
+        anything else goes through libsndfile.
+
+        Args:
+            path: Destination file.
+            waveform: Audio tensor data, shaped (channels, samples).
+            sample_rate: Audio sample rate.
+        """
+        if sample_rate == self.SUPPORTED_SAMPLE_RATE and waveform.shape[0] == 1:
+            pcm = (waveform.squeeze(0).clamp(-1.0, 1.0) * 32767.0).round().to(torch.int16)
+            pcm = pcm.cpu().numpy().astype('<i2', copy=False)
+
+            header = bytearray(self._wav_header_template)
+            struct.pack_into('<I', header, 4, 36 + pcm.nbytes)
+            struct.pack_into('<I', header, 40, pcm.nbytes)
+
+            with open(path, 'wb') as f:
+                f.write(header)
+                f.write(pcm.data)
+            return
+
+        # Save waveform as WAV file; soundfile expects (frames, channels).
+        # Tensor.cpu() returns the tensor itself when it is already on the CPU
+        sf.write(str(path), waveform.cpu().numpy().T, sample_rate, format='WAV', subtype='PCM_16')
+
+    def _score_batch(
+        self,
+        batch: List[Tuple[Path, Union[Tuple[torch.Tensor, int], Dict[str, Union[str, float]], None]]]
+    ) -> List[Optional[Dict[str, Union[str, float]]]]:
+        """Score preprocessed files with one batched UTMOSv2 call.
+
+        Waveforms are written under index-based names to one directory on the
+        processor's scratch space and scored with predict(input_dir=...), which
+        runs the model on all of them as a single batch. Falls back to scoring
+        each file on its own if the batched call fails.
+
+        Args:
+            batch: (file_path, audio_data) pairs as yielded by _iter_preprocessed.
+
+        Returns:
+            Results in input order, as returned by process_file.
+        """
+        results: List[Optional[Dict[str, Union[str, float]]]] = [None] * len(batch)
+        staged = []  # indices of files written to batch_dir
+
+        with tempfile.TemporaryDirectory(dir=self._temp_dir) as batch_dir:
+            for index, (file_path, audio_data) in enumerate(batch):
+                if audio_data is None or isinstance(audio_data, dict):
+                    results[index] = audio_data
+                    continue
+                try:
+                    self._write_wav(Path(batch_dir) / f"{index:06d}.wav", *audio_data)
+                    staged.append(index)
+                except Exception as e:
+                    self.logger.error("Failed to write batch WAV file", file=file_path.name, error=str(e))
+
+            if not staged:
+                return results
+
+            try:
+                predictions = self._run_predict(
+                    input_dir=batch_dir,
+                    batch_size=len(staged),
+                    device=self._inference_device
+                )
+            except Exception as e:
+                self.logger.warning("Batched prediction failed, scoring files one by one", error=str(e))
+                for index in staged:
+                    results[index] = self._score_waveform(*batch[index])
+                return results
+
+        for prediction in predictions:
+            index = int(Path(prediction['file_path']).stem)
+            file_path, (waveform, sample_rate) = batch[index]
+            duration_seconds = waveform.shape[-1] / sample_rate
+            mos_score = float(prediction['predicted_mos'])
+
+            results[index] = {
+                'file_path': str(file_path),
+                'mos': mos_score,
+                'duration_seconds': float(duration_seconds),
+                'sample_rate': int(sample_rate)
+            }
+            self.logger.info(
+                "UTMOSv2 assessment completed",
+                file=file_path.name,
+                mos_score=mos_score,
+                duration=float(duration_seconds)
+            )
+
+        return results
+
+    def _iter_scored_in_batches(
+        self,
+        audio_files: List[Path],
+        batch_size: int
+    ) -> Iterator[Tuple[Path, Optional[Dict[str, Union[str, float]]]]]:
+        """Yield (file_path, result) in order, scoring batch_size files per model call.
+
+        Args:
+            audio_files: Files to score.
+            batch_size: Files per batched predict() call.
+
+        Yields:
+            Tuple of (file_path, result), where result is as returned by process_file.
+        """
+        preprocessed = self._iter_preprocessed(audio_files)
+        while True:
+            batch = list(itertools.islice(preprocessed, batch_size))
+            if not batch:
+                return
+            yield from zip((file_path for file_path, _ in batch), self._score_batch(batch))
+
     @log_performance
     def process_directory(
         self,
         input_dir: Path,
         output_file: Optional[Path] = None,
-        recursive: bool = False
+        recursive: bool = False,
+        workers: int = 1,
+        batch_size: int = 1
     ) -> Dict[str, Union[List[Dict], Dict[str, float]]]:
         """Process all audio files in directory for batch assessment.
 
         Args:
             input_dir: Directory containing audio files to process.
             output_file: Optional path to save results. If None, returns results only.
+                While processing, each result is also appended to a uniquely named
+                temporary .ndjson file in the same directory as soon as it is known,
+                so an interrupted run keeps its completed files; the sidecar is
+                removed once the report is written.
             recursive: Whether to search subdirectories recursively.
+            workers: Number of worker processes, each with its own model. With 1,
+                files are scored in this process.
+            batch_size: Files scored per model call when scoring in this process.
+                Ignored when workers > 1.
 
         Returns:
             Dictionary containing:
@@ -259,15 +888,7 @@ class UTMOSv2Processor:
         self.logger.info("Starting batch UTMOSv2 processing", directory=str(input_dir))
 
         # Discover audio files
-        pattern = "**/*" if recursive else "*"
-        all_files = list(input_dir.glob(pattern))
-        audio_files = [
-            f for f in all_files
-            if f.is_file() and (
-                self.audio_processor.is_audio_file(f) or
-                self.audio_processor.is_video_file(f)
-            )
-        ]
+        audio_files = self._find_media_files(input_dir, recursive)
 
         if not audio_files:
             self.logger.warning("No audio files found", directory=str(input_dir))
@@ -277,24 +898,60 @@ class UTMOSv2Processor:
 
         # Process files with progress tracking
         results = []
-        successful_results = []
-
-        with tqdm(audio_files, desc="Processing files", unit="file") as pbar:
-            for file_path in pbar:
-                pbar.set_postfix({"current": file_path.name})
-
-                result = self.process_file(file_path)
-                if result:
-                    results.append(result)
-                    successful_results.append(result)
-                else:
-                    results.append({
+        successful = 0
+
+        ndjson = None
+        with contextlib.ExitStack() as stack:
+            if output_file:
+                # A fresh name, so no existing file next to the report is overwritten
+                ndjson = stack.enter_context(tempfile.NamedTemporaryFile(
+                    mode='w',
+                    encoding='utf-8',
+                    dir=output_file.parent,
+                    prefix=f".{output_file.name}.",
+                    suffix=".ndjson",
+                    delete=False
+                ))
+            # Progress redraws are rate-limited, and skipped entirely when stderr is not a terminal
+            pbar = stack.enter_context(tqdm(
+                total=len(audio_files),
+                desc="Processing files",
+                unit="file",
+                mininterval=self.PROGRESS_MIN_INTERVAL_SECONDS,
+                disable=not sys.stderr.isatty()
+            ))
+
+            if workers > 1:
+                if batch_size > 1:
+                    self.logger.warning("batch_size is ignored with worker processes", workers=workers)
+                scored = self._iter_scored_in_workers(audio_files, workers)
+            elif batch_size > 1:
+                scored = self._iter_scored_in_batches(audio_files, batch_size)
+            else:
+                scored = (
+                    (file_path, self._score_waveform(file_path, audio_data))
+                    for file_path, audio_data in self._iter_preprocessed(audio_files)
+                )
+
+            for file_path, result in scored:
+                # Let mininterval decide when to redraw, not every file
+                pbar.set_postfix({"current": file_path.name}, refresh=False)
+                pbar.update(1)
+                if not result:
+                    result = {
                         "file_path": str(file_path),
                         "error": "Processing failed"
-                    })
+                    }
+                elif "error" not in result:
+                    successful += 1
+                results.append(result)
+
+                if ndjson is not None:
+                    ndjson.write(json.dumps(result) + "\n")
+                    ndjson.flush()
 
-        # Calculate statistics
-        statistics = self._calculate_statistics(successful_results)
+        # Calculate statistics; failed results carry no "mos" and are skipped
+        statistics = self._calculate_statistics(results)
 
         # Prepare final results
         batch_results = {
@@ -302,26 +959,62 @@ class UTMOSv2Processor:
             "statistics": statistics,
             "metadata": {
                 "files_found": len(audio_files),
-                "files_processed": len(successful_results),
-                "success_rate": len(successful_results) / len(audio_files) if audio_files else 0.0,
+                "files_processed": successful,
+                "success_rate": successful / len(audio_files) if audio_files else 0.0,
                 "processor": "UTMOSv2",
                 "version": "1.0.0"
             }
         }
 
-        # Save results if output file specified
+        # The report is built from the in-memory results; the sidecar only
+        # guards against losing completed files to an interrupted run
         if output_file:
             self._save_results(batch_results, output_file)
+            Path(ndjson.name).unlink(missing_ok=True)
 
         self.logger.info(
             "Batch processing completed",
             total_files=len(audio_files),
-            successful=len(successful_results),
-            failed=len(audio_files) - len(successful_results)
+            successful=successful,
+            failed=len(audio_files) - successful
         )
 
         return batch_results
 
+    def _find_media_files(self, input_dir: Path, recursive: bool = False) -> List[Path]:
+        """Find supported audio and video files with one os.scandir pass per directory.
+
+        DirEntry type checks come from the directory listing itself, so no file
+        is stat'ed, and entries are filtered by extension before any Path is built.
+        Unreadable directories are skipped and symlinked directories are not
+        followed.
+
+        Args:
+            input_dir: Directory to search.
+            recursive: Whether to descend into subdirectories.
+
+        Returns:
+            Sorted list of media file paths.
+        """
+        media_files = []
+        pending = [str(input_dir)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            if self.audio_processor.is_media_suffix(os.path.splitext(entry.name)[1]):
+                                media_files.append(Path(entry.path))
+                        # Symlinked directories are not followed, so link cycles cannot loop
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+            except OSError as e:
+                # Unreadable directories are skipped, as glob does
+                self.logger.warning("Skipping unreadable directory", directory=directory, error=str(e))
+
+        return sorted(media_files)
+
     def _calculate_statistics(self, results: List[Dict]) -> Dict[str, float]:
         """Calculate statistical summary of MOS scores.
 
@@ -334,20 +1027,19 @@ class UTMOSv2Processor:
         if not results:
             return {}
 
-        mos_scores = [r["mos"] for r in results if "mos" in r]
+        mos_scores = np.fromiter((r["mos"] for r in results if "mos" in r), dtype=np.float64)
 
-        if not mos_scores:
+        if mos_scores.size == 0:
             return {}
 
-        import statistics
-
+        # Plain floats, so callers can serialize the statistics directly
         return {
-            "mean_mos": statistics.mean(mos_scores),
-            "median_mos": statistics.median(mos_scores),
-            "stdev_mos": statistics.stdev(mos_scores) if len(mos_scores) > 1 else 0.0,
-            "min_mos": min(mos_scores),
-            "max_mos": max(mos_scores),
-            "count": len(mos_scores)
+            "mean_mos": float(mos_scores.mean()),
+            "median_mos": float(np.median(mos_scores)),
+            "stdev_mos": float(mos_scores.std(ddof=1)) if mos_scores.size > 1 else 0.0,
+            "min_mos": float(mos_scores.min()),
+            "max_mos": float(mos_scores.max()),
+            "count": int(mos_scores.size)
         }
 
     def _save_results(self, results: Dict, output_file: Path) -> None:
@@ -407,6 +1099,27 @@ class UTMOSv2Processor:
             self.logger.error("Failed to save results", error=str(e), output_file=str(output_file))
 
 
+# Processor owned by a worker process of UTMOSv2Processor.process_directory
+_worker_processor: Optional[UTMOSv2Processor] = None
+
+
+def _init_worker(processor_kwargs: Dict, num_threads: int) -> None:
+    """Load a UTMOSv2 processor once per worker process.
+
+    Args:
+        processor_kwargs: Keyword arguments for UTMOSv2Processor.
+        num_threads: Intra-op threads for this worker's share of the CPU.
+    """
+    global _worker_processor
+    _worker_processor = UTMOSv2Processor(**processor_kwargs)
+    torch.set_num_threads(num_threads)
+
+
+def _score_in_worker(file_path: Path) -> Optional[Dict[str, Union[str, float]]]:
+    """Score one file with the worker process's processor."""
+    return _worker_processor.process_file(file_path)
+
+
 def main() -> None:
     """Command-line interface for UTMOSv2 processor."""
     import argparse
@@ -426,6 +1139,18 @@ Examples:
     parser.add_argument("--output", "-o", type=Path, help="Output results file")
     parser.add_argument("--recursive", "-r", action="store_true", help="Process directories recursively")
     parser.add_argument("--force-cpu", action="store_true", help="Force CPU usage")
+    parser.add_argument(
+        "--waveform-cache",
+        type=Path,
+        nargs="?",
+        const=UTMOSv2Processor.DEFAULT_WAVEFORM_CACHE_DIR,
+        metavar="DIR",
+        help="Cache preprocessed waveforms across runs (default dir: %(const)s)"
+    )
+    parser.add_argument("--script", action="store_true", help="Use a TorchScript model for CPU inference")
+    parser.add_argument("--bf16", action="store_true", help="Use bfloat16 autocast for CPU inference")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for directory input (default: 1)")
+    parser.add_argument("--batch-size", type=int, default=1, help="Files per model call for directory input (default: 1)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -435,12 +1160,20 @@ Examples:
     logger = setup_logger(__name__, level=log_level)
 
     try:
-        processor = UTMOSv2Processor(force_cpu=args.force_cpu)
+        processor = UTMOSv2Processor(
+            force_cpu=args.force_cpu,
+            waveform_cache_dir=args.waveform_cache,
+            script_model=args.script,
+            bf16=args.bf16
+        )
 
         if args.input.is_file():
             # Process single file
             result = processor.process_file(args.input)
-            if result:
+            if result and "error" in result:
+                logger.error("Processing failed", error=result["error"])
+                sys.exit(1)
+            elif result:
                 print(f"File: {result['file_path']}")
                 print(f"MOS Score: {result['mos']:.3f}")
                 if args.output:
@@ -459,7 +1192,9 @@ Examples:
             results = processor.process_directory(
                 args.input,
                 output_file=args.output,
-                recursive=args.recursive
+                recursive=args.recursive,
+                workers=args.workers,
+                batch_size=args.batch_size
             )
             print(f"Processed {results['metadata']['files_processed']} files")
             if results['statistics']:
@@ -10,18 +10,29 @@ Example:
     >>> audio_data = processor.load_and_preprocess("audio.mp3")
 """
 
+import os
 import subprocess
 import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
+import soundfile as sf
 import torch
 import torchaudio
+from torch.nn.utils.rnn import pad_sequence
 from torchaudio.transforms import Resample
 
 from .logging_utils import setup_logger
 
+try:
+    import av  # PyAV: optional in-process FFmpeg decoding
+except ImportError:
+    av = None
+
 
 class AudioFormat(Enum):
     """Supported audio formats with metadata."""
@@ -45,11 +56,7 @@ class AudioFormat(Enum):
         """
         if not extension.startswith('.'):
             extension = f'.{extension}'
-
-        for format_type in cls:
-            if format_type.value["extension"].lower() == extension.lower():
-                return format_type
-        return None
+        return cls._EXT_TO_FORMAT.get(extension.lower())
 
     @classmethod
     def supported_extensions(cls) -> List[str]:
@@ -57,6 +64,12 @@ class AudioFormat(Enum):
         return [format_type.value["extension"] for format_type in cls]
 
 
+# Built after the class body so the mapping is not itself picked up as a member.
+AudioFormat._EXT_TO_FORMAT = {
+    format_type.value["extension"].lower(): format_type for format_type in AudioFormat
+}
+
+
 class DeviceManager:
     """Manages compute device selection and optimization for ML workloads.
 
@@ -64,10 +77,18 @@ class DeviceManager:
     performance optimization for different hardware configurations.
     """
 
+    # Device availability cannot change within a process, so it is probed once
+    # and shared by every DeviceManager instance.
+    _detected_devices: Optional[Dict[str, bool]] = None
+
     def __init__(self) -> None:
         """Initialize device manager with automatic detection."""
         self.logger = setup_logger(__name__)
-        self._available_devices = self._detect_devices()
+        if DeviceManager._detected_devices is None:
+            DeviceManager._detected_devices = self._detect_devices()
+        self._available_devices = DeviceManager._detected_devices
+        self._optimal_devices: Dict[bool, torch.device] = {}
+        self._device_info: Optional[Dict[str, Union[str, int, float]]] = None
 
     def _detect_devices(self) -> Dict[str, bool]:
         """Detect available compute devices.
@@ -90,64 +111,106 @@ class DeviceManager:
             except Exception as e:
                 self.logger.warning("CUDA available but not functional", error=str(e))
 
-        # Check MPS (Apple Silicon) availability
-        if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-            try:
-                test_tensor = torch.tensor([1.0]).to("mps")
-                devices["mps"] = True
-                self.logger.info("MPS device detected and functional")
-            except Exception as e:
-                self.logger.warning("MPS available but not functional", error=str(e))
+        # Check MPS (Apple Silicon) availability from the backend flags; allocating a
+        # probe tensor would trigger Metal shader compilation just to detect the device
+        if (
+            hasattr(torch.backends, "mps")
+            and torch.backends.mps.is_available()
+            and torch.backends.mps.is_built()
+        ):
+            devices["mps"] = True
+            self.logger.info("MPS device available")
 
         return devices
 
     def get_optimal_device(self, prefer_gpu: bool = True) -> torch.device:
         """Get optimal compute device based on availability and preferences.
 
+        The choice is memoized per prefer_gpu value.
+
         Args:
             prefer_gpu: Whether to prefer GPU over CPU when available.
 
         Returns:
             Optimal torch.device for computation.
         """
+        device = self._optimal_devices.get(prefer_gpu)
+        if device is not None:
+            return device
+
+        device = torch.device("cpu")
         if prefer_gpu:
             if self._available_devices["cuda"]:
-                self.logger.info("Using CUDA device for processing")
-                return torch.device("cuda")
+                device = torch.device("cuda")
             elif self._available_devices["mps"]:
-                self.logger.info("Using MPS device for processing")
-                return torch.device("mps")
+                device = torch.device("mps")
 
-        self.logger.info("Using CPU device for processing")
-        return torch.device("cpu")
+        self.logger.info(f"Using {device.type.upper()} device for processing")
+        self._optimal_devices[prefer_gpu] = device
+        return device
 
     def get_device_info(self) -> Dict[str, Union[str, int, float]]:
         """Get detailed information about the selected device.
 
+        Static device properties are queried once; CUDA memory_allocated is
+        refreshed on every call since it changes as tensors are allocated.
+
         Returns:
             Dictionary containing device specifications and capabilities.
         """
-        device = self.get_optimal_device()
-        info = {
-            "device_type": device.type,
-            "device_index": getattr(device, 'index', 0)
-        }
+        if self._device_info is None:
+            device = self.get_optimal_device()
+            info = {
+                "device_type": device.type,
+                "device_index": getattr(device, 'index', 0)
+            }
+
+            if device.type == "cuda":
+                info.update({
+                    "cuda_version": torch.version.cuda,
+                    "device_name": torch.cuda.get_device_name(device),
+                    "memory_total": torch.cuda.get_device_properties(device).total_memory,
+                    "compute_capability": torch.cuda.get_device_capability(device)
+                })
+            elif device.type == "mps":
+                info.update({
+                    "mps_available": torch.backends.mps.is_available(),
+                    "mps_built": torch.backends.mps.is_built()
+                })
+
+            self._device_info = info
+
+        info = dict(self._device_info)
+        if info["device_type"] == "cuda":
+            info["memory_allocated"] = torch.cuda.memory_allocated(torch.device("cuda"))
+        return info
 
-        if device.type == "cuda":
-            info.update({
-                "cuda_version": torch.version.cuda,
-                "device_name": torch.cuda.get_device_name(device),
-                "memory_total": torch.cuda.get_device_properties(device).total_memory,
-                "memory_allocated": torch.cuda.memory_allocated(device),
-                "compute_capability": torch.cuda.get_device_capability(device)
-            })
-        elif device.type == "mps":
-            info.update({
-                "mps_available": torch.backends.mps.is_available(),
-                "mps_built": torch.backends.mps.is_built()
-            })
 
-        return info
+class _PostDecode(torch.nn.Module):
+    """Downmix, resample and peak-normalize a decoded (channels, samples) waveform.
+
+    Holds one fixed resampler so the whole chain can be compiled with
+    TorchScript per sample-rate pair.
+    """
+
+    def __init__(self, resampler: torch.nn.Module, normalize: bool) -> None:
+        super().__init__()
+        self.resampler = resampler
+        self.normalize = normalize
+
+    def forward(self, waveform: torch.Tensor) -> torch.Tensor:
+        # Convert to mono before resampling, which then filters half the samples for stereo
+        if waveform.shape[0] > 1:
+            waveform = waveform.mean(dim=0, keepdim=True)
+
+        waveform = self.resampler(waveform)
+
+        # Normalize amplitude in place. The inf-norm is a single reduction with no
+        # abs() temporary, and the clamp leaves silence unchanged without a host sync
+        if self.normalize:
+            peak = torch.linalg.vector_norm(waveform, ord=float("inf"))
+            waveform.div_(peak.clamp_min_(1e-8))
+        return waveform
 
 
 class AudioProcessor:
@@ -161,7 +224,11 @@ class AudioProcessor:
         supported_sample_rates: List of commonly used sample rates.
     """
 
-    SUPPORTED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm", ".m4v"}
+    SUPPORTED_AUDIO_EXTENSIONS = frozenset(ext.lower() for ext in AudioFormat.supported_extensions())
+    SUPPORTED_VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm", ".m4v"})
+    SUPPORTED_MEDIA_EXTENSIONS = SUPPORTED_AUDIO_EXTENSIONS | SUPPORTED_VIDEO_EXTENSIONS
+    # Formats libsndfile/torchaudio read directly; anything else goes straight to FFmpeg
+    DIRECT_DECODE_EXTENSIONS = frozenset({".wav", ".flac", ".ogg", ".mp3", ".aiff"})
     DEFAULT_SAMPLE_RATE = 16000
     DEFAULT_CHANNELS = 1
 
@@ -175,6 +242,42 @@ class AudioProcessor:
         self.device = device or DeviceManager().get_optimal_device()
         self.supported_sample_rates = [8000, 16000, 22050, 44100, 48000]
 
+        # Resamplers by (orig_sr, target_sr, device); building the sinc kernel is the expensive part
+        self._resamplers: Dict[Tuple[int, int, torch.device], Resample] = {}
+        # Scripted post-decode pipelines by (orig_sr, target_sr, normalize)
+        self._post_decoders: Dict[Tuple[int, int, bool], torch.nn.Module] = {}
+        # Shared scratch directory for FFmpeg outputs, created on first use
+        self._tmp: Optional[tempfile.TemporaryDirectory] = None
+
+    def __enter__(self) -> "AudioProcessor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the scratch directory and any files extracted or converted into it."""
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+    def _scratch_path(self, stem: str, extension: str) -> Path:
+        """Get a unique path for an FFmpeg output file in the shared scratch directory.
+
+        The directory lives until close() is called or the processor is garbage
+        collected.
+
+        Args:
+            stem: Readable prefix for the file name, typically the input stem.
+            extension: File extension including the leading dot.
+
+        Returns:
+            Path that does not exist yet.
+        """
+        if self._tmp is None:
+            self._tmp = tempfile.TemporaryDirectory(prefix="audiobox_")
+        return Path(self._tmp.name) / f"{stem}_{uuid.uuid4().hex}{extension}"
+
     def is_audio_file(self, file_path: Path) -> bool:
         """Check if file is a supported audio format.
 
@@ -184,7 +287,7 @@ class AudioProcessor:
         Returns:
             True if file is supported audio format.
         """
-        return AudioFormat.from_extension(file_path.suffix) is not None
+        return file_path.suffix.lower() in self.SUPPORTED_AUDIO_EXTENSIONS
 
     def is_video_file(self, file_path: Path) -> bool:
         """Check if file is a supported video format.
@@ -197,6 +300,20 @@ class AudioProcessor:
         """
         return file_path.suffix.lower() in self.SUPPORTED_VIDEO_EXTENSIONS
 
+    def is_media_suffix(self, suffix: str) -> bool:
+        """Check if a file extension is a supported audio or video format.
+
+        A single set lookup, for filtering large directory listings without
+        building Path objects.
+
+        Args:
+            suffix: File extension including the leading dot, in any case.
+
+        Returns:
+            True if the extension is a supported audio or video format.
+        """
+        return suffix.lower() in self.SUPPORTED_MEDIA_EXTENSIONS
+
     def validate_audio_file(self, file_path: Path) -> Tuple[bool, Optional[str]]:
         """Validate audio file integrity and format support.
 
@@ -206,23 +323,111 @@ class AudioProcessor:
         Returns:
             Tuple of (is_valid, error_message).
         """
-        if not file_path.exists():
-            return False, f"File does not exist: {file_path}"
+        return self._validate(file_path, file_path.suffix.lower())
+
+    def _validate(
+        self,
+        file_path: Path,
+        suffix: str,
+        header: Optional[Tuple[int, int]] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """Validate a file whose lowercased suffix the caller has already computed.
 
-        if not (self.is_audio_file(file_path) or self.is_video_file(file_path)):
+        Args:
+            file_path: Path to audio file to validate.
+            suffix: file_path.suffix.lower().
+            header: (num_frames, sample_rate) from read_header, if the caller
+                already has it; the file is then not opened again.
+
+        Returns:
+            Tuple of (is_valid, error_message).
+        """
+        is_audio = suffix in self.SUPPORTED_AUDIO_EXTENSIONS
+        if not (is_audio or suffix in self.SUPPORTED_VIDEO_EXTENSIONS):
             return False, f"Unsupported file format: {file_path.suffix}"
 
-        try:
-            if self.is_audio_file(file_path):
-                # Quick validation by loading metadata
-                info = torchaudio.info(str(file_path))
-                if info.num_frames <= 0:
-                    return False, "Audio file contains no frames"
-                if info.sample_rate <= 0:
-                    return False, "Invalid sample rate"
+        if not is_audio:
+            # Video headers are only read by the decoder, so a stat is the whole check
+            if not file_path.exists():
+                return False, f"File does not exist: {file_path}"
             return True, None
-        except Exception as e:
-            return False, f"Audio validation failed: {str(e)}"
+
+        if header is not None:
+            num_frames, sample_rate = header
+        else:
+            try:
+                # Quick validation by reading the header only; torchaudio for formats libsndfile cannot open
+                try:
+                    info = sf.info(str(file_path))
+                    num_frames, sample_rate = info.frames, info.samplerate
+                except Exception:
+                    info = torchaudio.info(str(file_path))
+                    num_frames, sample_rate = info.num_frames, info.sample_rate
+            except Exception as e:
+                # Opening the file is the existence check; only stat to explain a failure
+                if not file_path.exists():
+                    return False, f"File does not exist: {file_path}"
+                return False, f"Audio validation failed: {str(e)}"
+
+        if num_frames <= 0:
+            return False, "Audio file contains no frames"
+        if sample_rate <= 0:
+            return False, "Invalid sample rate"
+        return True, None
+
+    def read_header(self, file_path: Path) -> Optional[Tuple[int, int]]:
+        """Read an audio file's frame count and sample rate with libsndfile.
+
+        Only the header is parsed. The result can be passed to
+        load_and_preprocess so the file is not opened again to validate it.
+
+        Args:
+            file_path: Path to audio or video file.
+
+        Returns:
+            Tuple of (num_frames, sample_rate), or None for video files and
+            formats libsndfile cannot open.
+        """
+        if not self.is_audio_file(file_path):
+            return None
+        try:
+            info = sf.info(str(file_path))
+        except Exception:
+            return None
+        return info.frames, info.samplerate
+
+    def peek_duration(self, file_path: Path) -> Optional[float]:
+        """Read a media file's duration from its header without decoding it.
+
+        Uses libsndfile for formats it can open and falls back to ffprobe for
+        compressed audio and video containers.
+
+        Args:
+            file_path: Path to audio or video file.
+
+        Returns:
+            Duration in seconds, or None if it could not be determined.
+        """
+        header = self.read_header(file_path)
+        if header is not None:
+            num_frames, sample_rate = header
+            return num_frames / sample_rate if sample_rate > 0 else None
+
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(file_path)
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                return float(result.stdout.strip())
+        except (OSError, ValueError):
+            pass
+
+        self.logger.debug("Could not read media duration", file=file_path.name)
+        return None
 
     def extract_audio_from_video(self, video_path: Path, target_sample_rate: int = DEFAULT_SAMPLE_RATE) -> Optional[Path]:
         """Extract audio from video file using FFmpeg.
@@ -234,10 +439,8 @@ class AudioProcessor:
         Returns:
             Path to extracted audio file, or None if extraction failed.
         """
+        output_path = self._scratch_path(f"{video_path.stem}_extracted", ".wav")
         try:
-            temp_dir = Path(tempfile.mkdtemp())
-            output_path = temp_dir / f"{video_path.stem}_extracted.wav"
-
             cmd = [
                 "ffmpeg", "-i", str(video_path),
                 "-vn",  # No video output
@@ -260,11 +463,13 @@ class AudioProcessor:
                     stderr=result.stderr,
                     returncode=result.returncode
                 )
-                return None
 
         except Exception as e:
             self.logger.error("Audio extraction error", error=str(e))
-            return None
+
+        # Don't leave partial output behind in the shared directory
+        output_path.unlink(missing_ok=True)
+        return None
 
     def convert_audio_format(
         self,
@@ -284,10 +489,8 @@ class AudioProcessor:
         Returns:
             Path to converted audio file, or None if conversion failed.
         """
+        output_path = self._scratch_path(f"{input_path.stem}_converted", target_format.value["extension"])
         try:
-            temp_dir = Path(tempfile.mkdtemp())
-            output_path = temp_dir / f"{input_path.stem}_converted{target_format.value['extension']}"
-
             cmd = [
                 "ffmpeg", "-i", str(input_path),
                 "-acodec", target_format.value["codec"],
@@ -315,17 +518,279 @@ class AudioProcessor:
                     stderr=result.stderr,
                     returncode=result.returncode
                 )
-                return None
 
         except Exception as e:
             self.logger.error("Audio conversion error", error=str(e))
+
+        # Don't leave partial output behind in the shared directory
+        output_path.unlink(missing_ok=True)
+        return None
+
+    def _load_waveform(
+        self,
+        file_path: Path,
+        start_sec: float = 0.0,
+        duration_sec: Optional[float] = None
+    ) -> Tuple[torch.Tensor, int]:
+        """Decode an audio file, or a section of it, into a float32 (channels, samples) tensor.
+
+        libsndfile (WAV, FLAC, OGG, AIFF and, in recent versions, MP3) is far
+        faster than torchaudio's loader, so it is tried first; torchaudio is
+        only used for formats libsndfile cannot open. Sections are read by
+        seeking, so frames outside them are not decoded.
+
+        Args:
+            file_path: Path to audio file.
+            start_sec: Offset of the first frame to read, in seconds.
+            duration_sec: Length to read in seconds, or None to read to the end.
+
+        Returns:
+            Tuple of (waveform, sample_rate).
+
+        Raises:
+            RuntimeError: If neither decoder can read the file.
+        """
+        try:
+            with sf.SoundFile(str(file_path)) as f:
+                sample_rate = f.samplerate
+                start = int(start_sec * sample_rate) if start_sec > 0 else 0
+                if start:
+                    f.seek(start)
+                if self.device.type == "cuda" and f.channels == 1:
+                    # Decode straight into page-locked memory so the later host-to-device
+                    # copy needs no pin_memory() staging copy. With one channel the
+                    # transposed (1, frames) view is still contiguous
+                    frames = max(f.frames - start, 0)
+                    if duration_sec is not None:
+                        frames = min(frames, int(duration_sec * sample_rate))
+                    buffer = torch.empty((frames, 1), dtype=torch.float32, pin_memory=True)
+                    data = f.read(out=buffer.numpy())
+                    return buffer[:len(data)].T, sample_rate
+
+                frames = -1 if duration_sec is None else int(duration_sec * sample_rate)
+                data = f.read(frames, dtype='float32', always_2d=True)
+        except Exception:
+            if start_sec <= 0 and duration_sec is None:
+                return torchaudio.load(str(file_path))
+
+            sample_rate = torchaudio.info(str(file_path)).sample_rate
+            return torchaudio.load(
+                str(file_path),
+                frame_offset=int(start_sec * sample_rate),
+                num_frames=-1 if duration_sec is None else int(duration_sec * sample_rate)
+            )
+
+        if self.device.type == "cuda":
+            # Interleaved multichannel samples are de-interleaved into a contiguous
+            # (channels, frames) pinned buffer in one copy, so the device copy stays async
+            waveform = torch.empty((data.shape[1], data.shape[0]), dtype=torch.float32, pin_memory=True)
+            waveform.copy_(torch.from_numpy(data.T))
+            return waveform, sample_rate
+
+        # soundfile returns (frames, channels); from_numpy shares the buffer and the
+        # transpose is a view, so the decoded samples are never copied
+        return torch.from_numpy(data.T), sample_rate
+
+    def _decode_with_av(
+        self,
+        file_path: Path,
+        target_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        start_sec: float = 0.0,
+        duration_sec: Optional[float] = None
+    ) -> Tuple[torch.Tensor, int]:
+        """Decode the first audio stream of any FFmpeg-readable file in process.
+
+        Uses PyAV's bindings to libavformat/libavcodec, resampling to mono
+        float32 at target_sample_rate while decoding. Unlike the ffmpeg CLI
+        path, no subprocess is started and no temporary WAV is written. For a
+        section, the container is seeked to the keyframe before start_sec and
+        decoding stops once the section's end is reached.
+
+        Args:
+            file_path: Path to audio or video file.
+            target_sample_rate: Sample rate to decode to.
+            start_sec: Offset of the section to decode, in seconds.
+            duration_sec: Length of the section in seconds, or None for the rest.
+
+        Returns:
+            Tuple of (waveform, sample_rate) with a (1, samples) waveform.
+
+        Raises:
+            ValueError: If the file has no audio stream.
+            av.error.FFmpegError: If PyAV cannot open or decode the file.
+        """
+        end_sec = None if duration_sec is None else start_sec + duration_sec
+
+        with av.open(str(file_path)) as container:
+            if not container.streams.audio:
+                raise ValueError(f"No audio stream in {file_path.name}")
+            stream = container.streams.audio[0]
+
+            if start_sec > 0 and stream.time_base is not None:
+                # Lands on the keyframe at or before start_sec; the excess is trimmed below
+                container.seek(int(start_sec / stream.time_base), stream=stream)
+
+            resampler = av.AudioResampler(format='flt', layout='mono', rate=target_sample_rate)
+            chunks = []
+            first_frame_sec = None
+            for frame in container.decode(stream):
+                if first_frame_sec is None:
+                    first_frame_sec = frame.time if frame.time is not None else 0.0
+                if end_sec is not None and frame.time is not None and frame.time >= end_sec:
+                    break
+                chunks.extend(out.to_ndarray() for out in resampler.resample(frame))
+            # Flush samples still buffered in the resampler
+            chunks.extend(out.to_ndarray() for out in resampler.resample(None))
+
+        if not chunks:
+            raise ValueError(f"No audio decoded from {file_path.name}")
+
+        waveform = torch.from_numpy(np.concatenate(chunks, axis=-1))
+        if start_sec > 0 or duration_sec is not None:
+            # Decoding started at first_frame_sec, so offset the section by it
+            offset_sec = max(start_sec - (first_frame_sec or 0.0), 0.0)
+            waveform = self._slice_seconds(waveform, target_sample_rate, offset_sec, duration_sec)
+        return waveform, target_sample_rate
+
+    def _decode_with_ffmpeg(
+        self,
+        file_path: Path,
+        target_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        start_sec: float = 0.0,
+        duration_sec: Optional[float] = None
+    ) -> Optional[Tuple[torch.Tensor, int]]:
+        """Decode the audio of any FFmpeg-readable file through the ffmpeg CLI.
+
+        FFmpeg writes mono 16-bit PCM to stdout, which is read into memory, so
+        no temporary file is written. Sections are selected with -ss/-t so
+        FFmpeg skips the rest of the input.
+
+        Args:
+            file_path: Path to audio or video file.
+            target_sample_rate: Sample rate FFmpeg resamples to.
+            start_sec: Offset of the section to decode, in seconds.
+            duration_sec: Length of the section in seconds, or None for the rest.
+
+        Returns:
+            Tuple of (waveform, sample_rate) with a (1, samples) float32
+            waveform, or None if FFmpeg failed.
+        """
+        cmd = ["ffmpeg", "-loglevel", "error"]
+        if start_sec > 0:
+            cmd += ["-ss", str(start_sec)]
+        if duration_sec is not None:
+            cmd += ["-t", str(duration_sec)]
+        cmd += [
+            "-i", str(file_path),
+            "-vn",  # No video output
+            "-f", "s16le", "-acodec", "pcm_s16le",  # Raw 16-bit PCM
+            "-ar", str(target_sample_rate),
+            "-ac", str(self.DEFAULT_CHANNELS),
+            "pipe:1"
+        ]
+
+        self.logger.info("Decoding audio with FFmpeg", file=file_path.name)
+        try:
+            result = subprocess.run(cmd, capture_output=True)
+        except Exception as e:
+            self.logger.error("FFmpeg decode error", error=str(e))
             return None
 
+        if result.returncode != 0 or not result.stdout:
+            self.logger.error(
+                "FFmpeg decode failed",
+                stderr=result.stderr.decode(errors="replace"),
+                returncode=result.returncode
+            )
+            return None
+
+        # astype copies out of the read-only stdout buffer, so the scale can run in place
+        pcm = np.frombuffer(result.stdout, dtype='<i2').astype(np.float32)
+        pcm /= 32768.0
+        return torch.from_numpy(pcm).unsqueeze(0), target_sample_rate
+
+    @staticmethod
+    def _slice_seconds(
+        waveform: torch.Tensor,
+        sample_rate: int,
+        start_sec: float = 0.0,
+        duration_sec: Optional[float] = None
+    ) -> torch.Tensor:
+        """Return a view of a (channels, samples) waveform covering the given section.
+
+        Args:
+            waveform: Decoded audio.
+            sample_rate: Sample rate of waveform.
+            start_sec: Section start in seconds.
+            duration_sec: Section length in seconds, or None for the rest.
+
+        Returns:
+            Sliced waveform view.
+        """
+        start = int(start_sec * sample_rate)
+        end = None if duration_sec is None else start + int(duration_sec * sample_rate)
+        return waveform[:, start:end]
+
+    def _get_resampler(self, orig_sample_rate: int, target_sample_rate: int) -> Resample:
+        """Get a cached resampler for a rate pair on the processor's device.
+
+        Args:
+            orig_sample_rate: Source sample rate in Hz.
+            target_sample_rate: Target sample rate in Hz.
+
+        Returns:
+            Resample module whose kernel lives on self.device.
+        """
+        key = (orig_sample_rate, target_sample_rate, self.device)
+        resampler = self._resamplers.get(key)
+        if resampler is None:
+            resampler = Resample(orig_sample_rate, target_sample_rate, dtype=torch.float32).to(self.device)
+            self._resamplers[key] = resampler
+        return resampler
+
+    def _get_post_decoder(
+        self,
+        orig_sample_rate: int,
+        target_sample_rate: int,
+        normalize: bool
+    ) -> torch.nn.Module:
+        """Get a cached, TorchScript-compiled post-decode pipeline.
+
+        Falls back to the eager module if scripting fails, e.g. on a torchaudio
+        build whose Resample is not scriptable.
+
+        Args:
+            orig_sample_rate: Sample rate of the decoded audio in Hz.
+            target_sample_rate: Target sample rate in Hz.
+            normalize: Whether the pipeline peak-normalizes its output.
+
+        Returns:
+            Module mapping a (channels, samples) waveform on self.device to a
+            mono, resampled and optionally normalized one.
+        """
+        key = (orig_sample_rate, target_sample_rate, normalize)
+        post_decoder = self._post_decoders.get(key)
+        if post_decoder is None:
+            if orig_sample_rate != target_sample_rate:
+                resampler = self._get_resampler(orig_sample_rate, target_sample_rate)
+            else:
+                resampler = torch.nn.Identity()
+            post_decoder = _PostDecode(resampler, normalize).to(self.device)
+            try:
+                post_decoder = torch.jit.script(post_decoder)
+            except Exception as e:
+                self.logger.warning("Post-decode scripting failed, running eagerly", error=str(e))
+            self._post_decoders[key] = post_decoder
+        return post_decoder
+
     def load_and_preprocess(
         self,
         file_path: Path,
         target_sample_rate: int = DEFAULT_SAMPLE_RATE,
-        normalize: bool = True
+        normalize: bool = True,
+        start_sec: float = 0.0,
+        duration_sec: Optional[float] = None,
+        header: Optional[Tuple[int, int]] = None
     ) -> Optional[Tuple[torch.Tensor, int]]:
         """Load and preprocess audio file for ML model consumption.
 
@@ -333,69 +798,236 @@ class AudioProcessor:
             file_path: Path to audio file.
             target_sample_rate: Target sample rate for preprocessing.
             normalize: Whether to normalize audio amplitude.
+            start_sec: Offset into the audio to start loading from, in seconds.
+            duration_sec: Length of audio to load in seconds, or None for the rest
+                of the file. Frames outside the section are not decoded.
+            header: (num_frames, sample_rate) from read_header, if already read.
 
         Returns:
             Tuple of (audio_tensor, sample_rate) or None if loading failed.
         """
         try:
-            # Validate file first
-            is_valid, error_msg = self.validate_audio_file(file_path)
-            if not is_valid:
-                self.logger.error("Audio validation failed", error=error_msg)
+            decoded = self._decode(file_path, target_sample_rate, start_sec, duration_sec, header)
+            if decoded is None:
                 return None
 
-            processing_path = file_path
+            # Pinned host memory lets the copy to a GPU run asynchronously. The
+            # explicit float32 keeps float64 decoder output off MPS fallback paths
+            waveform, sample_rate = decoded
+            waveform = waveform.to(self.device, dtype=torch.float32, non_blocking=True)
+            return self._postprocess(file_path, waveform, sample_rate, target_sample_rate, normalize)
 
-            # Handle video files by extracting audio
-            if self.is_video_file(file_path):
-                extracted_path = self.extract_audio_from_video(file_path, target_sample_rate)
-                if not extracted_path:
-                    return None
-                processing_path = extracted_path
+        except Exception as e:
+            self.logger.error("Audio preprocessing failed", error=str(e))
+            return None
 
-            # Handle non-WAV audio files by converting
-            elif file_path.suffix.lower() != '.wav':
-                converted_path = self.convert_audio_format(file_path)
-                if not converted_path:
-                    return None
-                processing_path = converted_path
+    def load_and_preprocess_batch(
+        self,
+        file_paths: List[Path],
+        target_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        normalize: bool = True,
+        max_workers: Optional[int] = None
+    ) -> List[Optional[Tuple[torch.Tensor, int]]]:
+        """Load and preprocess several audio files, decoding them in parallel.
+
+        Decoding (libsndfile, torchaudio, PyAV or FFmpeg, all of which release
+        the GIL) runs in a thread pool while this thread copies finished files
+        to the device and downmixes them, in order. On CUDA the copies are
+        issued on a separate stream from pinned memory, so the next file's
+        upload overlaps the current file's device work. Files that share a
+        source sample rate are then resampled together in one padded batch.
+        All decoded files may be held in memory at once, so callers should pass
+        bounded batches.
 
-            # Load audio with torchaudio
-            waveform, sample_rate = torchaudio.load(str(processing_path))
+        Args:
+            file_paths: Paths to audio or video files.
+            target_sample_rate: Target sample rate for preprocessing.
+            normalize: Whether to normalize audio amplitude.
+            max_workers: Decoding threads. Defaults to the CPU count.
 
-            # Resample if needed
-            if sample_rate != target_sample_rate:
-                resampler = Resample(sample_rate, target_sample_rate)
-                waveform = resampler(waveform)
-                sample_rate = target_sample_rate
+        Returns:
+            One (audio_tensor, sample_rate) tuple per input, in input order, or
+            None where loading failed.
+        """
+        def decode(file_path: Path) -> Optional[Tuple[torch.Tensor, int]]:
+            try:
+                return self._decode(file_path, target_sample_rate)
+            except Exception as e:
+                self.logger.error("Audio preprocessing failed", file=file_path.name, error=str(e))
+                return None
 
-            # Convert to mono if stereo
-            if waveform.shape[0] > 1:
-                waveform = torch.mean(waveform, dim=0, keepdim=True)
+        copy_stream = torch.cuda.Stream(self.device) if self.device.type == "cuda" else None
+
+        # Mono waveforms on the device, at their source rate
+        prepared: List[Optional[Tuple[torch.Tensor, int]]] = []
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            for file_path, decoded in zip(file_paths, pool.map(decode, file_paths)):
+                if decoded is None:
+                    prepared.append(None)
+                    continue
+
+                waveform, sample_rate = decoded
+                try:
+                    if copy_stream is not None:
+                        compute_stream = torch.cuda.current_stream(self.device)
+                        with torch.cuda.stream(copy_stream):
+                            waveform = waveform.to(self.device, dtype=torch.float32, non_blocking=True)
+                        compute_stream.wait_stream(copy_stream)
+                        # Allocated on the copy stream but consumed on the compute stream
+                        waveform.record_stream(compute_stream)
+                    else:
+                        waveform = waveform.to(self.device, dtype=torch.float32)
+
+                    if waveform.shape[0] > 1:
+                        waveform = waveform.mean(dim=0, keepdim=True)
+                    prepared.append((waveform, sample_rate))
+                except Exception as e:
+                    self.logger.error("Audio preprocessing failed", file=file_path.name, error=str(e))
+                    prepared.append(None)
+
+        self._resample_grouped(prepared, target_sample_rate)
+
+        results: List[Optional[Tuple[torch.Tensor, int]]] = []
+        for file_path, item in zip(file_paths, prepared):
+            if item is None:
+                results.append(None)
+                continue
+            try:
+                results.append(
+                    self._postprocess(file_path, item[0], item[1], target_sample_rate, normalize)
+                )
+            except Exception as e:
+                self.logger.error("Audio preprocessing failed", file=file_path.name, error=str(e))
+                results.append(None)
 
-            # Normalize amplitude
-            if normalize:
-                max_val = torch.max(torch.abs(waveform))
-                if max_val > 0:
-                    waveform = waveform / max_val
+        return results
 
-            # Move to target device
-            waveform = waveform.to(self.device)
+    def _resample_grouped(
+        self,
+        prepared: List[Optional[Tuple[torch.Tensor, int]]],
+        target_sample_rate: int
+    ) -> None:
+        """Resample mono waveforms that share a source rate with one convolution per rate.
+
+        Waveforms are right-padded with zeros into a (batch, samples) tensor,
+        which matches the zero padding Resample applies to each clip on its own,
+        so trimming each row back to its resampled length gives the same
+        samples as resampling the clips one by one. Entries are replaced in
+        place; rates with a single clip, and groups that fail, are left for
+        per-file resampling.
 
-            self.logger.info(
-                "Audio preprocessing completed",
-                file=file_path.name,
-                duration_s=waveform.shape[-1] / sample_rate,
-                sample_rate=sample_rate,
-                channels=waveform.shape[0]
-            )
+        Args:
+            prepared: (1, samples) waveforms and their sample rates, or None.
+            target_sample_rate: Target sample rate in Hz.
+        """
+        groups: Dict[int, List[int]] = {}
+        for index, item in enumerate(prepared):
+            if item is not None and item[1] != target_sample_rate:
+                groups.setdefault(item[1], []).append(index)
+
+        for sample_rate, indices in groups.items():
+            if len(indices) < 2:
+                continue
+            try:
+                lengths = [prepared[index][0].shape[-1] for index in indices]
+                batch = pad_sequence([prepared[index][0][0] for index in indices], batch_first=True)
+                resampled = self._get_resampler(sample_rate, target_sample_rate)(batch)
+            except Exception as e:
+                self.logger.warning("Batched resample failed", sample_rate=sample_rate, error=str(e))
+                continue
 
-            # Clean up temporary files
-            if processing_path != file_path and processing_path.exists():
-                processing_path.unlink()
+            for row, (index, length) in enumerate(zip(indices, lengths)):
+                new_length = -(-length * target_sample_rate // sample_rate)  # exact ceil
+                prepared[index] = (resampled[row:row + 1, :new_length], target_sample_rate)
 
-            return waveform, sample_rate
+    def _decode(
+        self,
+        file_path: Path,
+        target_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        start_sec: float = 0.0,
+        duration_sec: Optional[float] = None,
+        header: Optional[Tuple[int, int]] = None
+    ) -> Optional[Tuple[torch.Tensor, int]]:
+        """Validate and decode a media file into a host-memory waveform.
 
-        except Exception as e:
-            self.logger.error("Audio preprocessing failed", error=str(e))
-            return None
\ No newline at end of file
+        Safe to run from worker threads. Nothing is written to disk; FFmpeg
+        output is piped back into memory.
+
+        Args:
+            file_path: Path to audio or video file.
+            target_sample_rate: Rate that FFmpeg/PyAV decoding resamples to.
+            start_sec: Offset into the audio to start loading from, in seconds.
+            duration_sec: Length of audio to load in seconds, or None for the rest.
+            header: (num_frames, sample_rate) from read_header, if already read.
+
+        Returns:
+            Tuple of (waveform, sample_rate) with a CPU (channels, samples)
+            waveform, in pinned memory when the processor's device is CUDA;
+            or None if validation or conversion failed.
+        """
+        # Validate file first; the suffix is parsed once for validation and routing
+        suffix = file_path.suffix.lower()
+        is_valid, error_msg = self._validate(file_path, suffix, header)
+        if not is_valid:
+            self.logger.error("Audio validation failed", error=error_msg)
+            return None
+
+        waveform = None
+        if suffix in self.DIRECT_DECODE_EXTENSIONS:
+            try:
+                waveform, sample_rate = self._load_waveform(file_path, start_sec, duration_sec)
+            except Exception as e:
+                # Unusual codec inside a supported container, decode with FFmpeg
+                self.logger.debug("Direct decode failed, converting", file=file_path.name, error=str(e))
+
+        # Video and formats like M4A/AAC, in process with PyAV when installed
+        if waveform is None:
+            if av is not None:
+                try:
+                    waveform, sample_rate = self._decode_with_av(
+                        file_path, target_sample_rate, start_sec, duration_sec
+                    )
+                except (av.error.FFmpegError, ValueError) as e:
+                    self.logger.debug("PyAV decode failed, using ffmpeg", file=file_path.name, error=str(e))
+            if waveform is None:
+                decoded = self._decode_with_ffmpeg(file_path, target_sample_rate, start_sec, duration_sec)
+                if decoded is None:
+                    return None
+                waveform, sample_rate = decoded
+
+        if self.device.type == "cuda" and not waveform.is_pinned():
+            waveform = waveform.pin_memory()
+        return waveform, sample_rate
+
+    def _postprocess(
+        self,
+        file_path: Path,
+        waveform: torch.Tensor,
+        sample_rate: int,
+        target_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        normalize: bool = True
+    ) -> Tuple[torch.Tensor, int]:
+        """Downmix, resample and normalize a waveform already on the processor's device.
+
+        Args:
+            file_path: Source file, used for logging.
+            waveform: (channels, samples) audio on self.device.
+            sample_rate: Sample rate of waveform.
+            target_sample_rate: Target sample rate for preprocessing.
+            normalize: Whether to normalize audio amplitude.
+
+        Returns:
+            Tuple of (audio_tensor, sample_rate).
+        """
+        waveform = self._get_post_decoder(sample_rate, target_sample_rate, normalize)(waveform)
+        sample_rate = target_sample_rate
+
+        self.logger.info(
+            "Audio preprocessing completed",
+            file=file_path.name,
+            duration_s=waveform.shape[-1] / sample_rate,
+            sample_rate=sample_rate,
+            channels=waveform.shape[0]
+        )
+
+        return waveform, sample_rate
\ No newline at end of file
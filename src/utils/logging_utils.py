@@ -9,8 +9,11 @@ Example:
     >>> logger.info("Processing started", file_count=42, batch_size=10)
 """
 
+import functools
 import logging
+import os
 import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -18,6 +21,69 @@ import structlog
 from rich.console import Console
 from rich.logging import RichHandler
 
+try:
+    import orjson  # Optional: much faster JSON rendering
+except ImportError:
+    orjson = None
+
+# Structured loggers already handed out by setup_logger, by name
+_structured_loggers: Dict[str, "StructuredLogger"] = {}
+_structlog_configured = False
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """Serialize a log record with orjson.
+
+    Returns str rather than orjson's bytes, as the stdlib logging handlers expect.
+    """
+    return orjson.dumps(obj, default=default).decode()
+
+
+def _render_tracebacks(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Render stack and exception info only for records that carry them.
+
+    Both processors walk frames; checking for the keys first keeps them off
+    the path of the plain records that make up nearly all output.
+    """
+    if event_dict.get("stack_info"):
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+    if event_dict.get("exc_info"):
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+def _configure_structlog() -> None:
+    """Configure structlog processors for production use.
+
+    structlog configuration is global, so it is applied once per process; later
+    calls return immediately. Records below the LOG_LEVEL environment variable
+    (default INFO) are dropped by the bound logger before any processor runs.
+    """
+    global _structlog_configured
+    if _structlog_configured:
+        return
+    _structlog_configured = True
+
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.TimeStamper(fmt="iso"),
+            _render_tracebacks,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+            if orjson is not None else structlog.processors.JSONRenderer()
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
+        ),
+        cache_logger_on_first_use=True,
+    )
+
 
 class StructuredLogger:
     """Production-grade structured logger with contextual information.
@@ -37,28 +103,9 @@ class StructuredLogger:
             name: Logger name, typically module or component name.
             level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         """
+        _configure_structlog()
         self.logger = structlog.get_logger(name)
         self.context: Dict[str, Any] = {}
-        self._setup_processors()
-
-    def _setup_processors(self) -> None:
-        """Configure structlog processors for production use."""
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.add_logger_name,
-                structlog.processors.TimeStamper(fmt="iso"),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer()
-            ],
-            context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
 
     def bind(self, **kwargs: Any) -> "StructuredLogger":
         """Bind context to logger for subsequent log calls.
@@ -105,7 +152,9 @@ def setup_logger(
     """Setup production-grade logger with configurable outputs.
 
     Creates a logger configured for production use with structured output,
-    console formatting, and optional file output.
+    console formatting, and optional file output. Idempotent by name: later
+    calls for an already configured logger return it unchanged instead of
+    attaching new handlers or reopening the log file.
 
     Args:
         name: Logger name, typically module or component name.
@@ -122,15 +171,17 @@ def setup_logger(
         >>> logger.info("Processing started", file_count=10)
     """
     if structured:
-        logger = StructuredLogger(name, level)
+        logger = _structured_loggers.get(name)
+        if logger is None:
+            logger = _structured_loggers[name] = StructuredLogger(name, level)
         return logger
 
     # Standard library logger setup
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    if logger.handlers:
+        return logger
 
-    # Clear any existing handlers
-    logger.handlers.clear()
+    logger.setLevel(getattr(logging, level.upper()))
 
     # Console handler with rich formatting
     if console_output:
@@ -175,34 +226,20 @@ def log_performance(func):
     Returns:
         Wrapped function with performance logging.
     """
-    import time
-    import functools
+    # Resolved once at decoration time; setup_logger is cached by name anyway, but
+    # this keeps the per-call cost down to two clock reads and a level check
+    logger = setup_logger(func.__module__)
+    level_logger = logging.getLogger(func.__module__)
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = setup_logger(func.__module__)
-        start_time = time.perf_counter()
+        start_ns = time.monotonic_ns()
 
         try:
             result = func(*args, **kwargs)
-            end_time = time.perf_counter()
-            execution_time = end_time - start_time
-
-            if hasattr(logger, 'info'):
-                logger.info(
-                    f"Function {func.__name__} completed",
-                    execution_time_s=round(execution_time, 4),
-                    function=func.__name__,
-                    module=func.__module__
-                )
-
-            return result
-
         except Exception as e:
-            end_time = time.perf_counter()
-            execution_time = end_time - start_time
-
-            if hasattr(logger, 'error'):
+            if level_logger.isEnabledFor(logging.ERROR):
+                execution_time = (time.monotonic_ns() - start_ns) * 1e-9
                 logger.error(
                     f"Function {func.__name__} failed",
                     execution_time_s=round(execution_time, 4),
@@ -210,7 +247,17 @@ def log_performance(func):
                     function=func.__name__,
                     module=func.__module__
                 )
-
             raise
 
+        if level_logger.isEnabledFor(logging.INFO):
+            execution_time = (time.monotonic_ns() - start_ns) * 1e-9
+            logger.info(
+                f"Function {func.__name__} completed",
+                execution_time_s=round(execution_time, 4),
+                function=func.__name__,
+                module=func.__module__
+            )
+
+        return result
+
     return wrapper
\ No newline at end of file